@@ -1,18 +1,58 @@
 """Utilities for standardizing structures and deriving downstream artifacts."""
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import shutil
+import sys
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from integrations.boltzgen import generate_boltzgen_yaml
-from pipeline.cdr import annotate_cdrs
+from pipeline.cdr import _write_cdr_csv, annotate_cdrs
 from pipeline.epitope.mapping import MappingResidueV2, MappingResultV2, build_residue_mapping_v2
 from pipeline.epitope.standardize import StandardizedStructure, standardize_structure
 
 LOGGER = logging.getLogger(__name__)
 
+# minimum normalized alignment score for a confident CDR placement (exact
+# match scores 2.0 on this scale)
+_MIN_NORMALIZED_SCORE = 1.5
+
+# Memoizes the expensive scaffold work (standardize + mapping + CDR
+# annotation) keyed on input content digest, numbering scheme, and scaffold
+# chain so repeat submissions of an unchanged scaffold skip straight to
+# artifact emission. Bounded: entries hold full mapping/residue objects, so
+# an unbounded dict would grow forever in a long-lived worker.
+_SCAFFOLD_CACHE: Dict[
+    Tuple[str, str, Optional[str]],
+    Tuple[StandardizedStructure, MappingResultV2, Dict[str, object]],
+] = {}
+_SCAFFOLD_CACHE_MAX = 8
+
+
+def _write_json(path: Path, payload: object) -> None:
+    """Serialize payload as indented JSON, via orjson when available."""
+
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(payload, indent=2))
+
+
+def _content_digest(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 try:  # pragma: no cover - optional dependency
     from Bio import pairwise2
     from Bio.Data.IUPACData import protein_letters_3to1_extended as _AA_MAP
@@ -20,6 +60,21 @@ except ModuleNotFoundError:  # pragma: no cover - optional dependency
     pairwise2 = None
     _AA_MAP = {}
 
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    np = None
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:  # pragma: no cover - optional dependency
+    import edlib
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    edlib = None
+
 
 def normalize_and_derive(
     scaffold_path: str,
@@ -37,42 +92,96 @@ def normalize_and_derive(
     scaffold_dir.mkdir(parents=True, exist_ok=True)
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    scaffold_standardized = standardize_structure(Path(scaffold_path), scaffold_dir)
-    scaffold_mapping = build_residue_mapping_v2(scaffold_standardized)
-    scaffold_mapping_path = scaffold_dir / "mapping.json"
-    scaffold_mapping.write_json(scaffold_mapping_path)
+    # Scaffold and target standardization are independent (separate output
+    # dirs, no shared state) and gemmi releases the GIL, so overlap the
+    # target work with the scaffold-side processing below. HLT and BoltzGen
+    # YAML generation are likewise submitted as soon as their scaffold-side
+    # inputs are ready instead of waiting for the target join.
+    executor = ThreadPoolExecutor(max_workers=3)
+    target_future = None
+    if target_path:
+        target_future = executor.submit(_standardize_and_map, Path(target_path), target_dir)
 
     scaffold_cdr_dir = scaffold_dir / "cdr"
-    cdr_payload = annotate_cdrs(
-        Path(scaffold_path),
-        scaffold_cdr_dir,
-        scheme=numbering_scheme,
-        chain_id=chain_role_map.get("scaffold"),
-    )
     scaffold_cdr_json = scaffold_cdr_dir / "cdr_annotations.json"
 
+    scaffold_key = (
+        _content_digest(Path(scaffold_path)),
+        numbering_scheme,
+        chain_role_map.get("scaffold"),
+    )
+    cached_scaffold = _SCAFFOLD_CACHE.get(scaffold_key)
+    if cached_scaffold is not None and Path(cached_scaffold[0].standardized_path).exists():
+        cached_standardized, scaffold_mapping, cdr_payload = cached_scaffold
+        # cache hit: materialize the cached outputs into this run's scaffold
+        # dir so every reported path stays inside the current output tree,
+        # and re-emit both CDR artifacts without re-parsing or re-annotating
+        scaffold_standardized = _materialize_cached_scaffold(cached_standardized, scaffold_dir)
+        if scaffold_standardized is not cached_standardized:
+            # rebind the mapping onto the materialized structure too — its
+            # serialized source_structure paths (consumed by the runner and
+            # the BoltzGen spec) must not leak the populating run's dir
+            scaffold_mapping = replace(scaffold_mapping, standardized=scaffold_standardized)
+        scaffold_cdr_dir.mkdir(parents=True, exist_ok=True)
+        _write_json(scaffold_cdr_json, cdr_payload)
+        _write_cdr_csv(scaffold_cdr_json.with_suffix(".csv"), cdr_payload.get("cdrs", []))
+    else:
+        scaffold_standardized = standardize_structure(Path(scaffold_path), scaffold_dir)
+        scaffold_mapping = build_residue_mapping_v2(scaffold_standardized)
+        cdr_payload = annotate_cdrs(
+            Path(scaffold_path),
+            scaffold_cdr_dir,
+            scheme=numbering_scheme,
+            chain_id=chain_role_map.get("scaffold"),
+        )
+        if len(_SCAFFOLD_CACHE) >= _SCAFFOLD_CACHE_MAX:
+            _SCAFFOLD_CACHE.pop(next(iter(_SCAFFOLD_CACHE)))
+        _SCAFFOLD_CACHE[scaffold_key] = (scaffold_standardized, scaffold_mapping, dict(cdr_payload))
+
+    scaffold_mapping_path = scaffold_dir / "mapping.json"
+    scaffold_mapping.write_json(scaffold_mapping_path)
+
     cdr_mapping_path = scaffold_dir / "cdr_label_mapping.json"
     cdr_mapping_payload = _map_cdrs_to_standardized(
         cdr_payload,
         scaffold_mapping,
         chain_id=chain_role_map.get("scaffold"),
     )
-    cdr_mapping_path.write_text(json.dumps(cdr_mapping_payload, indent=2))
+    _write_json(cdr_mapping_path, cdr_mapping_payload)
 
     hlt_path = scaffold_dir / "scaffold.HLT.pdb"
     chain_map_path = hlt_path.with_suffix(".chain_map.json")
-    try:
-        generate_hlt(
+    hlt_future = executor.submit(
+        generate_hlt,
+        scaffold_standardized,
+        scaffold_mapping,
+        cdr_mapping_payload,
+        hlt_path,
+        chain_role_map or {},
+    )
+
+    boltzgen_yaml_path = scaffold_dir / "boltzgen.yaml"
+
+    def _generate_boltzgen_yaml_task() -> Path:
+        target_standardized_path = None
+        if target_future is not None:
+            target_standardized_path = target_future.result()[0].standardized_path
+        return generate_boltzgen_yaml(
             scaffold_standardized,
             scaffold_mapping,
             cdr_mapping_payload,
-            hlt_path,
-            chain_role_map or {},
+            target_standardized_path,
+            boltzgen_yaml_path,
         )
-        hlt_chain_map = chain_map_path
+
+    boltzgen_future = executor.submit(_generate_boltzgen_yaml_task)
+
+    try:
+        hlt_future.result()
+        hlt_ok = True
     except Exception as exc:  # noqa: BLE001
         LOGGER.warning("HLT generation failed: %s", exc)
-        hlt_chain_map = None
+        hlt_ok = False
 
     # --- JSON-serializable artifacts only (paths and primitive-friendly payloads) ---
     artifacts: Dict[str, object] = {
@@ -82,9 +191,10 @@ def normalize_and_derive(
         # CDR artifacts (annotate_cdrs already wrote these files)
         "scaffold_cdr_annotations_json": str(scaffold_cdr_json),
         "scaffold_cdr_mappings_json": str(cdr_mapping_path),
-        # HLT / chain_map
-        "scaffold_hlt_path": str(hlt_path) if hlt_path.exists() else None,
-        "scaffold_chain_map_json": str(chain_map_path) if hlt_chain_map and chain_map_path.exists() else None,
+        # HLT / chain_map (written together by generate_hlt, so success of the
+        # call implies both paths exist without re-statting them)
+        "scaffold_hlt_path": str(hlt_path) if hlt_ok else None,
+        "scaffold_chain_map_json": str(chain_map_path) if hlt_ok else None,
         # boltzgen YAML (path or None)
         "boltzgen_yaml_path": None,
         # target artifacts (populated below if target exists)
@@ -101,36 +211,62 @@ def normalize_and_derive(
         }
     )
 
-    target_standardized = None
-    if target_path:
-        target_standardized = standardize_structure(Path(target_path), target_dir)
-        target_mapping = build_residue_mapping_v2(target_standardized)
-        target_mapping_path = target_dir / "mapping.json"
-        target_mapping.write_json(target_mapping_path)
-
-        artifacts.update(
-            {
-                "target_standardized_path": str(target_standardized.standardized_path),
-                "target_mapping_json": str(target_mapping_path),
-            }
-        )
-
     try:
-        boltzgen_yaml_path = scaffold_dir / "boltzgen.yaml"
-        boltz_yaml = generate_boltzgen_yaml(
-            scaffold_standardized,
-            scaffold_mapping,
-            cdr_mapping_payload,
-            target_standardized.standardized_path if target_standardized else None,
-            boltzgen_yaml_path,
-        )
-        artifacts["boltzgen_yaml_path"] = str(boltz_yaml)
-    except Exception as exc:  # noqa: BLE001
-        LOGGER.warning("BoltzGen YAML generation failed: %s", exc)
+        if target_future is not None:
+            target_standardized, target_mapping = target_future.result()
+            target_mapping_path = target_dir / "mapping.json"
+            target_mapping.write_json(target_mapping_path)
+
+            artifacts.update(
+                {
+                    "target_standardized_path": str(target_standardized.standardized_path),
+                    "target_mapping_json": str(target_mapping_path),
+                }
+            )
+
+        try:
+            artifacts["boltzgen_yaml_path"] = str(boltzgen_future.result())
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("BoltzGen YAML generation failed: %s", exc)
+    finally:
+        executor.shutdown(wait=False)
 
     return artifacts
 
 
+def _standardize_and_map(structure_path: Path, out_dir: Path) -> Tuple[StandardizedStructure, MappingResultV2]:
+    standardized = standardize_structure(structure_path, out_dir)
+    return standardized, build_residue_mapping_v2(standardized)
+
+
+def _materialize_cached_scaffold(cached: StandardizedStructure, scaffold_dir: Path) -> StandardizedStructure:
+    """Link or copy a cached standardized scaffold into this run's directory.
+
+    Cache entries keep the paths of the run that populated them; reusing
+    them verbatim would report artifact paths inside a previous run's output
+    dir. Hardlink into the current ``scaffold_dir`` (copy across filesystems)
+    and rebind ``standardized_path``. A symlink would not do: the .cif is
+    the canonical file external design tools consume, and a link into the
+    populating run's dir dangles as soon as that dir is cleaned up.
+    """
+
+    source = Path(cached.standardized_path).resolve()
+    destination = scaffold_dir / source.name
+    if destination.resolve() == source:
+        return cached
+    try:
+        if destination.is_symlink() or destination.exists():
+            destination.unlink()
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copy2(source, destination)
+    except OSError as exc:  # noqa: BLE001
+        LOGGER.warning("Could not materialize cached scaffold into %s: %s", scaffold_dir, exc)
+        return cached
+    return replace(cached, standardized_path=destination)
+
+
 def _map_cdrs_to_standardized(
     cdr_payload: Dict[str, object],
     mapping: MappingResultV2,
@@ -140,6 +276,11 @@ def _map_cdrs_to_standardized(
         reason = cdr_payload.get("reason", "cdr annotation unavailable") if isinstance(cdr_payload, dict) else "cdr annotation unavailable"
         return {"status": "failed", "reason": reason, "cdr_mappings": []}
 
+    segments = cdr_payload.get("cdrs", [])
+    if not segments:
+        # nothing to map; skip the chain-sequence build entirely
+        return {"status": "succeeded", "chain_id": chain_id, "cdr_mappings": []}
+
     chain_sequences = _chain_sequences(mapping)
     target_chain_id = chain_id or next(iter(chain_sequences), None)
     if not target_chain_id:
@@ -155,30 +296,91 @@ def _map_cdrs_to_standardized(
         }
 
     mappings: List[Dict[str, object]] = []
-    for segment in cdr_payload.get("cdrs", []):
+    for segment in segments:
         mapped = _map_segment_to_chain(segment, chain_info["sequence"], chain_info["residues"])
         mappings.append(mapped)
 
     return {"status": "succeeded", "chain_id": target_chain_id, "cdr_mappings": mappings}
 
 
+# Memoizes _chain_sequences per live MappingResultV2 so repeated
+# normalization calls against the same mapping skip the rebuild. Entries are
+# evicted via weakref callback when the mapping is garbage collected.
+_CHAIN_SEQ_CACHE: Dict[int, Tuple["weakref.ref", Dict[str, Dict[str, object]]]] = {}
+
+
 def _chain_sequences(mapping: MappingResultV2) -> Dict[str, Dict[str, object]]:
+    cache_key = id(mapping)
+    cached = _CHAIN_SEQ_CACHE.get(cache_key)
+    if cached is not None and cached[0]() is mapping:
+        return cached[1]
+
+    # Single pass over mapping.residues: bucket per chain while tracking
+    # whether each bucket arrives already ordered, so the common in-order
+    # case skips both by_chain()'s intermediate dict and the sort.
+    buckets: Dict[str, List[MappingResidueV2]] = {}
+    in_order: Dict[str, bool] = {}
+    for res in mapping.residues:
+        chain_id = res.auth.chain
+        bucket = buckets.get(chain_id)
+        if bucket is None:
+            buckets[chain_id] = [res]
+            in_order[chain_id] = True
+        else:
+            if in_order[chain_id] and bucket[-1].present_seq_id > res.present_seq_id:
+                in_order[chain_id] = False
+            bucket.append(res)
+
     chains: Dict[str, Dict[str, object]] = {}
-    for chain_id, residues in mapping.by_chain().items():
-        sorted_residues = sorted(residues, key=lambda res: res.present_seq_id)
-        sequence = "".join(_three_to_one(res.resname3) for res in sorted_residues)
+    for chain_id, residues in buckets.items():
+        sorted_residues = residues if in_order[chain_id] else _sort_by_present_seq_id(residues)
+        sequence = "".join(_RES3_TO_1.get(res.resname3.upper(), "X") for res in sorted_residues)
         chains[chain_id] = {"sequence": sequence, "residues": sorted_residues}
+
+    try:
+        ref = weakref.ref(mapping, lambda _ref, key=cache_key: _CHAIN_SEQ_CACHE.pop(key, None))
+    except TypeError:  # pragma: no cover - mapping type without weakref support
+        pass
+    else:
+        _CHAIN_SEQ_CACHE[cache_key] = (ref, chains)
     return chains
 
 
+# Uppercased copy of the Biopython 3-to-1 table built once at import so the
+# per-residue hot path is a single dict probe instead of .upper()/.title()
+# retries per call.
+_RES3_TO_1: Dict[str, str] = {key.upper(): value for key, value in _AA_MAP.items()}
+
+
+def _sort_by_present_seq_id(residues: Sequence[MappingResidueV2]) -> List[MappingResidueV2]:
+    """Order residues by present_seq_id with an O(n) bucket pass.
+
+    present_seq_id values are densely packed 1-based counters in the common
+    case, so placing each residue at its own index avoids Timsort's per-element
+    key lambda. Sparse or non-positive ids fall back to ``sorted``.
+    """
+
+    if not residues:
+        return []
+
+    max_id = max(res.present_seq_id for res in residues)
+    if max_id <= 0 or max_id > 4 * len(residues):
+        return sorted(residues, key=lambda res: res.present_seq_id)
+
+    buckets: List[Optional[MappingResidueV2]] = [None] * (max_id + 1)
+    for res in residues:
+        seq_id = res.present_seq_id
+        if seq_id < 0 or buckets[seq_id] is not None:
+            # duplicate or negative ids: let Timsort keep its stable semantics
+            return sorted(residues, key=lambda res: res.present_seq_id)
+        buckets[seq_id] = res
+    return [res for res in buckets if res is not None]
+
+
 def _three_to_one(resname: str) -> str:
     if not resname:
         return "X"
-    res_upper = resname.upper()
-    try:
-        return _AA_MAP.get(res_upper, _AA_MAP.get(res_upper.title(), "X"))
-    except Exception:  # noqa: BLE001
-        return "X"
+    return _RES3_TO_1.get(resname.upper(), "X")
 
 
 def _map_segment_to_chain(
@@ -250,6 +452,10 @@ def _locate_subsequence(chain_sequence: str, query: str) -> Optional[Dict[str, o
     if not chain_sequence:
         return None
 
+    # prefer edlib (bit-parallel C aligner) over pairwise2 when available
+    if edlib is not None:
+        return _edlib_locate(chain_sequence, query)
+
     # if biopython present, use local alignment with a normalized score threshold
     if pairwise2:
         try:
@@ -272,19 +478,121 @@ def _locate_subsequence(chain_sequence: str, query: str) -> Optional[Dict[str, o
                 next_norm = scored[1][0]
                 if (best_norm - next_norm) / max(best_norm, 1e-9) < 0.05:
                     ambiguous = True
-            # threshold: require normalized score >= 1.5 (tunable)
-            MIN_NORMALIZED_SCORE = 1.5
-            if best_norm < MIN_NORMALIZED_SCORE:
+            if best_norm < _MIN_NORMALIZED_SCORE:
                 return None
             return {"start": int(best_start), "score": float(best_norm), "ambiguous": ambiguous}
         except Exception as exc:  # pragma: no cover - fallback
             LOGGER.warning("pairwise2 alignment failed; falling back to substring search: %s", exc)
 
-    # fallback: strict substring find
+    # fallback: strict substring find, then vectorized approximate match
     idx = chain_sequence.find(query)
     if idx >= 0:
         return {"start": idx, "score": float(len(query)), "ambiguous": False}
-    return None
+    return _sliding_window_best_match(chain_sequence, query)
+
+
+def _edlib_locate(chain_sequence: str, query: str) -> Optional[Dict[str, object]]:
+    """Infix (HW-mode) alignment of query against chain_sequence via edlib.
+
+    Mirrors the pairwise2 branch contract: a dict with start/score/ambiguous
+    keys, with the score normalized so an exact match is 2.0 and the same
+    acceptance threshold applies.
+    """
+
+    result = edlib.align(query, chain_sequence, mode="HW", task="locations")
+    distance = result.get("editDistance", -1)
+    if distance < 0:
+        return None
+
+    norm = 2.0 * (len(query) - distance) / max(len(query), 1)
+    if norm < _MIN_NORMALIZED_SCORE:
+        return None
+
+    starts = sorted({loc[0] for loc in result.get("locations", []) if loc and loc[0] is not None})
+    if not starts:
+        return None
+    return {"start": int(starts[0]), "score": float(norm), "ambiguous": len(starts) > 1}
+
+
+# Lazily compiled Numba kernel for the approximate search on very long
+# chains, where materializing the sliding-window view costs more than the
+# comparison itself. None until first use; stays None when Numba is absent.
+_NUMBA_KERNEL = None
+_NUMBA_CHECKED = False
+
+# chains at least this long route through the Numba kernel when available
+_NUMBA_MIN_CHAIN_LEN = 10_000
+
+
+def _get_numba_kernel():
+    global _NUMBA_KERNEL, _NUMBA_CHECKED
+    if _NUMBA_CHECKED:
+        return _NUMBA_KERNEL
+    _NUMBA_CHECKED = True
+    try:  # pragma: no cover - optional dependency
+        from numba import njit  # noqa: WPS433
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
+        return None
+
+    @njit(cache=True)
+    def _best_match(chain, query):  # pragma: no cover - compiled path
+        best_i = -1
+        best_m = query.size + 1
+        ties = 0
+        for i in range(chain.size - query.size + 1):
+            m = 0
+            for j in range(query.size):
+                if chain[i + j] != query[j]:
+                    m += 1
+                    # strict: a window matching best_m so far may still be a
+                    # true tie and must finish its scan to be counted as one
+                    if m > best_m:
+                        break
+            if m < best_m:
+                best_m = m
+                best_i = i
+                ties = 1
+            elif m == best_m:
+                ties += 1
+        return best_i, best_m, ties
+
+    _NUMBA_KERNEL = _best_match
+    return _NUMBA_KERNEL
+
+
+def _sliding_window_best_match(chain_sequence: str, query: str) -> Optional[Dict[str, object]]:
+    """Best approximate (Hamming-distance) match of query in chain_sequence.
+
+    Compares every window of the chain against the query in a single NumPy
+    broadcast instead of an O(n*m) Python loop; very long chains use a Numba
+    kernel when available to avoid materializing the window view. Returns the
+    same payload shape as :func:`_locate_subsequence` or None when NumPy is
+    unavailable, the query is longer than the chain, or the best window has
+    too many mismatches.
+    """
+
+    if np is None or not query or len(query) > len(chain_sequence):
+        return None
+
+    chain_arr = np.frombuffer(chain_sequence.encode(), dtype=np.uint8)
+    query_arr = np.frombuffer(query.encode(), dtype=np.uint8)
+
+    kernel = _get_numba_kernel() if len(chain_sequence) >= _NUMBA_MIN_CHAIN_LEN else None
+    if kernel is not None:
+        start_idx, best, ties = kernel(chain_arr, query_arr)
+        start_idx, best, ambiguous = int(start_idx), int(best), int(ties) > 1
+    else:
+        windows = np.lib.stride_tricks.sliding_window_view(chain_arr, query_arr.shape[0])
+        mismatches = np.count_nonzero(windows != query_arr, axis=1)
+        start_idx = int(mismatches.argmin())
+        best = int(mismatches[start_idx])
+        ambiguous = int(np.count_nonzero(mismatches == best)) > 1
+
+    # accept up to ~20% mismatches (at least one) before declaring no match
+    if start_idx < 0 or best > max(1, len(query) // 5):
+        return None
+
+    return {"start": start_idx, "score": float(len(query) - best), "ambiguous": ambiguous}
 
 
 def generate_hlt(
@@ -329,16 +637,25 @@ def generate_hlt(
             new_model.add_chain(new_chain)
         new_structure.add_model(new_model)
 
-    new_structure.write_pdb(str(output_hlt_path))
     chain_map_path = output_hlt_path.with_suffix(".chain_map.json")
-    chain_map_path.write_text(json.dumps(chain_name_map, indent=2))
+    _write_json(chain_map_path, chain_name_map)
 
     absolute_by_label, absolute_by_present = _absolute_index_maps(
         new_structure, reverse_chain_map, scaffold_mapping
     )
     remark_lines = _format_cdr_remarks(cdr_annotations, absolute_by_label, absolute_by_present)
-    if remark_lines:
-        _inject_remarks(output_hlt_path, remark_lines)
+
+    if remark_lines and hasattr(new_structure, "make_pdb_string"):
+        # render the PDB in memory, splice the REMARKs after the header, and
+        # write once instead of write + re-read + rewrite
+        pdb_text = new_structure.make_pdb_string()
+        first_line, _, rest = pdb_text.partition("\n")
+        output_hlt_path.write_text(first_line + "\n" + "\n".join(remark_lines) + "\n" + rest)
+        _record_remark_validation(output_hlt_path, remark_lines)
+    else:
+        new_structure.write_pdb(str(output_hlt_path))
+        if remark_lines:
+            _inject_remarks(output_hlt_path, remark_lines)
 
     return output_hlt_path
 
@@ -383,11 +700,11 @@ def _assign_chain_names(chain_names: Sequence[str], chain_role_map: Dict[str, st
             mapping[chain] = roles[chain]
             used_roles.add(roles[chain])
 
-    unassigned_chains = [c for c in chain_names if c not in mapping]
+    unassigned_chains = deque(c for c in chain_names if c not in mapping)
     for role in ("H", "L", "T"):
         if role in used_roles or not unassigned_chains:
             continue
-        chain = unassigned_chains.pop(0)
+        chain = unassigned_chains.popleft()
         mapping[chain] = role
         used_roles.add(role)
 
@@ -404,27 +721,41 @@ def _assign_chain_names(chain_names: Sequence[str], chain_role_map: Dict[str, st
 
 def _ordered_chains(chain_names: Sequence[str], chain_name_map: Dict[str, str]) -> List[str]:
     prioritized = {"H": 0, "L": 1, "T": 2}
-    return sorted(chain_names, key=lambda name: (prioritized.get(chain_name_map.get(name, ""), 3), chain_names.index(name)))
+    positions = {name: idx for idx, name in enumerate(chain_names)}
+    return sorted(chain_names, key=lambda name: (prioritized.get(chain_name_map.get(name, ""), 3), positions[name]))
 
 
 def _absolute_index_maps(
     structure, reverse_chain_map: Dict[str, str], mapping: MappingResultV2
 ) -> tuple[Dict[tuple[str, int], int], Dict[str, Dict[int, int]]]:
-    mapping_by_label = {(res.label_asym_id, res.label_seq_id): res for res in mapping.residues}
+    # Two-level {chain: {seq_id: res}} lookup avoids allocating a key tuple
+    # per residue on the hot .get path; chain ids are interned since the same
+    # few strings repeat for every residue.
+    mapping_by_chain: Dict[str, Dict[int, MappingResidueV2]] = {}
+    for res in mapping.residues:
+        mapping_by_chain.setdefault(sys.intern(res.label_asym_id), {})[res.label_seq_id] = res
 
     absolute_by_label: Dict[tuple[str, int], int] = {}
     absolute_by_present: Dict[str, Dict[int, int]] = {}
     absolute_idx = 1
 
+    # pre-bound method references keep the per-residue loop on LOAD_FAST
+    # instead of repeated attribute dispatch
+    label_setitem = absolute_by_label.__setitem__
+    reverse_get = reverse_chain_map.get
+    present_setdefault = absolute_by_present.setdefault
+
     for chain in structure[0]:
-        orig_name = reverse_chain_map.get(chain.name, chain.name)
+        orig_name = reverse_get(chain.name, chain.name)
+        chain_table = mapping_by_chain.get(orig_name)
+        chain_table_get = chain_table.get if chain_table is not None else None
         for residue in chain:
             seq_id = residue.seqid.num
-            absolute_by_label[(orig_name, seq_id)] = absolute_idx
+            label_setitem((orig_name, seq_id), absolute_idx)
 
-            mapping_res = mapping_by_label.get((orig_name, seq_id))
+            mapping_res = chain_table_get(seq_id) if chain_table_get else None
             if mapping_res:
-                chain_map = absolute_by_present.setdefault(mapping_res.auth.chain, {})
+                chain_map = present_setdefault(mapping_res.auth.chain, {})
                 chain_map[mapping_res.present_seq_id] = absolute_idx
 
             absolute_idx += 1
@@ -456,8 +787,12 @@ def _format_cdr_remarks(
             continue
 
         cdr_name = cdr.get("cdr_name") or "CDR"
-        lines.append(f"REMARK PDBinfo-LABEL: {start_abs:4d} {cdr_name}_start")
-        lines.append(f"REMARK PDBinfo-LABEL: {end_abs:4d} {cdr_name}_end")
+        lines.extend(
+            (
+                f"REMARK PDBinfo-LABEL: {start_abs:4d} {cdr_name}_start",
+                f"REMARK PDBinfo-LABEL: {end_abs:4d} {cdr_name}_end",
+            )
+        )
 
     return lines
 
@@ -483,19 +818,24 @@ def _lookup_absolute_index(
 
 
 def _inject_remarks(output_hlt_path: Path, remark_lines: List[str]) -> None:
-    original = output_hlt_path.read_text().splitlines()
-    updated = []
-    if original:
-        updated.append(original[0])
-        updated.extend(remark_lines)
-        updated.extend(original[1:])
-    else:
-        updated = remark_lines
-
-    output_hlt_path.write_text("\n".join(updated) + "\n")
+    # Stream the rewrite through a temp file instead of materializing the
+    # whole PDB twice: copy the header line, emit the REMARKs, then bulk-copy
+    # the remainder.
+    tmp_path = output_hlt_path.with_suffix(".tmp")
+    with output_hlt_path.open("r") as src, tmp_path.open("w") as dst:
+        first_line = src.readline()
+        if first_line:
+            dst.write(first_line if first_line.endswith("\n") else first_line + "\n")
+        dst.write("\n".join(remark_lines) + "\n")
+        shutil.copyfileobj(src, dst, length=1 << 20)
+    os.replace(tmp_path, output_hlt_path)
+    _record_remark_validation(output_hlt_path, remark_lines)
+
+
+def _record_remark_validation(output_hlt_path: Path, remark_lines: List[str]) -> None:
     validation = _validate_remarks(output_hlt_path, remark_lines)
     validation_path = output_hlt_path.with_suffix(".remark_validation.json")
-    validation_path.write_text(json.dumps(validation, indent=2))
+    _write_json(validation_path, validation)
     if not validation.get("ok", False):
         raise RuntimeError(
             f"Remark validation failed for {output_hlt_path}; details written to {validation_path}"
@@ -2,25 +2,37 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib.util
 import json
 import logging
+import os
 import shlex
 import subprocess
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
+_RFAB_AVAILABLE: Optional[bool] = None
+
 
 def ensure_rfantibody_available() -> bool:
-    """Lightweight probe to check RFantibody integration availability."""
-    try:
-        import importlib  # noqa: WPS433
+    """Lightweight probe to check RFantibody integration availability.
 
-        importlib.import_module("rfantibody")
-    except ModuleNotFoundError:
-        return False
-    return True
+    Consults the import finders without executing the package and caches the
+    answer, so per-task probes after the first are a plain attribute read.
+    """
+    global _RFAB_AVAILABLE
+    if _RFAB_AVAILABLE is None:
+        _RFAB_AVAILABLE = importlib.util.find_spec("rfantibody") is not None
+    return _RFAB_AVAILABLE
 
 
 def run_rfantibody(
@@ -41,6 +53,112 @@ def run_rfantibody(
 ) -> Dict[str, object]:
     """Execute RFantibody RFdiffusion inference and collect outputs."""
 
+    exec_cmd, task_root, output_dir, stdout_path, stderr_path = _prepare_invocation(
+        task_dir,
+        hlt_path,
+        target_path,
+        hotspots_resolved=hotspots_resolved,
+        design_loops=design_loops,
+        num_designs=num_designs,
+        user_params=user_params,
+        normalization=normalization,
+        use_docker=use_docker,
+        docker_image=docker_image,
+        cache_dir=cache_dir,
+    )
+
+    cmd_str = " ".join(map(shlex.quote, exec_cmd))
+    attempt = 0
+    returncode: Optional[int] = None
+    while attempt <= max(retries, 0):
+        attempt += 1
+        LOGGER.info("Running RFantibody (attempt %s): %s", attempt, cmd_str)
+        returncode = _run_streaming(exec_cmd, task_root, stdout_path, stderr_path, timeout)
+        if returncode == 0:
+            break
+        LOGGER.warning("RFantibody attempt %s failed with code %s", attempt, returncode)
+
+    return _finalize_result(exec_cmd, returncode, output_dir, stdout_path, stderr_path)
+
+
+async def run_rfantibody_async(
+    task_dir: Union[str, Path],
+    hlt_path: Union[str, Path],
+    target_path: Union[str, Path],
+    hotspots_resolved: Optional[Iterable[Dict[str, object]]] = None,
+    design_loops: Optional[Sequence[Union[str, Dict[str, object]]]] = None,
+    num_designs: int = 20,
+    *,
+    user_params: Optional[Dict[str, Any]] = None,
+    normalization: Optional[Dict[str, Any]] = None,
+    use_docker: Optional[bool] = None,
+    docker_image: str = "rfantibody",
+    timeout: int = 3600,
+    retries: int = 1,
+    cache_dir: Path | None = None,
+) -> Dict[str, object]:
+    """Async counterpart of :func:`run_rfantibody`.
+
+    Lets a driver dispatch several RFantibody jobs concurrently with
+    ``asyncio.gather`` while each subprocess streams its logs to disk.
+    """
+
+    exec_cmd, task_root, output_dir, stdout_path, stderr_path = _prepare_invocation(
+        task_dir,
+        hlt_path,
+        target_path,
+        hotspots_resolved=hotspots_resolved,
+        design_loops=design_loops,
+        num_designs=num_designs,
+        user_params=user_params,
+        normalization=normalization,
+        use_docker=use_docker,
+        docker_image=docker_image,
+        cache_dir=cache_dir,
+    )
+
+    cmd_str = " ".join(map(shlex.quote, exec_cmd))
+    attempt = 0
+    returncode: Optional[int] = None
+    while attempt <= max(retries, 0):
+        attempt += 1
+        LOGGER.info("Running RFantibody (attempt %s): %s", attempt, cmd_str)
+        with stdout_path.open("wb") as stdout_handle, stderr_path.open("wb") as stderr_handle:
+            proc = await asyncio.create_subprocess_exec(
+                *exec_cmd,
+                cwd=str(task_root),
+                stdout=stdout_handle,
+                stderr=stderr_handle,
+            )
+            try:
+                returncode = await asyncio.wait_for(proc.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+        if returncode == 0:
+            break
+        LOGGER.warning("RFantibody attempt %s failed with code %s", attempt, returncode)
+
+    return _finalize_result(exec_cmd, returncode, output_dir, stdout_path, stderr_path)
+
+
+def _prepare_invocation(
+    task_dir: Union[str, Path],
+    hlt_path: Union[str, Path],
+    target_path: Union[str, Path],
+    *,
+    hotspots_resolved: Optional[Iterable[Dict[str, object]]],
+    design_loops: Optional[Sequence[Union[str, Dict[str, object]]]],
+    num_designs: int,
+    user_params: Optional[Dict[str, Any]],
+    normalization: Optional[Dict[str, Any]],
+    use_docker: Optional[bool],
+    docker_image: str,
+    cache_dir: Path | None,
+) -> tuple[List[str], Path, Path, Path, Path]:
+    """Build the RFantibody command line and task directory layout."""
+
     task_root = Path(task_dir).resolve()
     logs_dir = task_root / "logs"
     logs_dir.mkdir(parents=True, exist_ok=True)
@@ -112,95 +230,150 @@ def run_rfantibody(
     else:
         exec_cmd = base_cmd
 
-    LOGGER.info("Running RFantibody command: %s", " ".join(map(shlex.quote, exec_cmd)))
-
     stdout_path = logs_dir / "rfantibody.stdout.log"
     stderr_path = logs_dir / "rfantibody.stderr.log"
 
-    attempt = 0
-    completed: subprocess.CompletedProcess[str] | None = None
-    while attempt <= max(retries, 0):
-        attempt += 1
-        LOGGER.info("Running RFantibody (attempt %s): %s", attempt, " ".join(map(shlex.quote, exec_cmd)))
-        completed = subprocess.run(
+    return exec_cmd, task_root, output_dir, stdout_path, stderr_path
+
+
+def _run_streaming(
+    exec_cmd: Sequence[str],
+    task_root: Path,
+    stdout_path: Path,
+    stderr_path: Path,
+    timeout: int,
+) -> int:
+    """Run the command with stdout/stderr streamed straight to the log files.
+
+    Streaming keeps memory flat for multi-hour GPU jobs and leaves partial
+    logs on disk if the process crashes, unlike PIPE capture which buffers
+    everything in memory until completion.
+    """
+
+    with stdout_path.open("wb") as stdout_handle, stderr_path.open("wb") as stderr_handle:
+        proc = subprocess.Popen(
             exec_cmd,
             cwd=str(task_root),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            timeout=timeout,
-            check=False,
+            stdout=stdout_handle,
+            stderr=stderr_handle,
         )
-        stdout_path.write_text(completed.stdout)
-        stderr_path.write_text(completed.stderr)
-        if completed.returncode == 0:
-            break
-        LOGGER.warning("RFantibody attempt %s failed with code %s", attempt, completed.returncode)
-
+        try:
+            return proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+
+
+def _finalize_result(
+    exec_cmd: List[str],
+    returncode: Optional[int],
+    output_dir: Path,
+    stdout_path: Path,
+    stderr_path: Path,
+) -> Dict[str, object]:
     result: Dict[str, object] = {
-        "status": "succeeded" if completed and completed.returncode == 0 else "failed",
-        "returncode": completed.returncode if completed else None,
+        "status": "succeeded" if returncode == 0 else "failed",
+        "returncode": returncode,
         "command": exec_cmd,
         "stdout_log": str(stdout_path),
         "stderr_log": str(stderr_path),
         "output_dir": str(output_dir),
     }
 
-    if completed and completed.returncode == 0:
+    if returncode == 0:
         result.update(_collect_outputs(output_dir))
     else:
         result["reason"] = "RFantibody execution failed"
         LOGGER.error(
             "RFantibody inference failed with code %s. See %s",
-            completed.returncode if completed else "?",
+            returncode if returncode is not None else "?",
             stderr_path,
         )
 
     return result
 
 
+@functools.lru_cache(maxsize=256)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file, memoized on path + stat signature.
+
+    run_rfantibody reads the same normalization payloads several times per
+    invocation; the stat signature keeps the cache honest when a file is
+    rewritten between calls.
+    """
+
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _load_json(path_or_obj: Any) -> Any:
     if path_or_obj is None:
         return None
     if isinstance(path_or_obj, (str, Path)):
         try:
-            return json.loads(Path(path_or_obj).read_text())
-        except (FileNotFoundError, json.JSONDecodeError):
+            stat = os.stat(path_or_obj)
+            return _load_json_cached(str(path_or_obj), stat.st_mtime_ns, stat.st_size)
+        except (FileNotFoundError, ValueError):
             LOGGER.warning("Failed to load JSON from %s", path_or_obj)
             return None
     return path_or_obj
 
 
+# field priority for hotspot tokens, resolved with one early-exit scan per
+# hotspot instead of chained dict.get or-expressions
+_RESOLVED_CHAIN_FIELDS = ("chain", "label_asym_id")
+_RESOLVED_RESI_FIELDS = ("label_seq_id", "present_seq_id", "auth_resi")
+_HOTSPOT_CHAIN_FIELDS = ("chain", "auth_chain", "chain_id")
+_HOTSPOT_RESI_FIELDS = ("resi", "label_seq_id", "present_seq_id", "auth_seq_id", "seq_id")
+
+
+def _first_field(entry: Dict[str, Any], fields: Sequence[str], default: Any = None) -> Any:
+    for key in fields:
+        value = entry.get(key)
+        if value:
+            return value
+    return default
+
+
+def _hotspot_token(hotspot: Any) -> Optional[str]:
+    if isinstance(hotspot, str):
+        return hotspot.replace(":", "")
+    chain = _first_field(hotspot, _HOTSPOT_CHAIN_FIELDS, "T")
+    residue_id = _first_field(hotspot, _HOTSPOT_RESI_FIELDS)
+    if chain and residue_id is not None:
+        return f"{chain}{residue_id}"
+    return None
+
+
 def _format_hotspots_for_rf(hotspots_input: Any, mapping: Any = None) -> str:
-    tokens: List[str] = []
     if not hotspots_input:
         return ""
 
     if isinstance(hotspots_input, dict) and hotspots_input.get("status") == "succeeded":
-        for hotspot in hotspots_input.get("hotspots", []):
-            chain = hotspot.get("chain") or hotspot.get("label_asym_id")
-            residue_id = hotspot.get("label_seq_id") or hotspot.get("present_seq_id") or hotspot.get("auth_resi")
-            if chain and residue_id is not None:
-                tokens.append(f"{chain}{residue_id}")
-        return ",".join(tokens)
+        return ",".join(
+            f"{chain}{residue_id}"
+            for hotspot in hotspots_input.get("hotspots", [])
+            if (chain := _first_field(hotspot, _RESOLVED_CHAIN_FIELDS))
+            and (residue_id := _first_field(hotspot, _RESOLVED_RESI_FIELDS)) is not None
+        )
 
     if isinstance(hotspots_input, (list, tuple)):
-        for hotspot in hotspots_input:
-            if isinstance(hotspot, str):
-                tokens.append(hotspot.replace(":", ""))
-                continue
+        return ",".join(token for token in map(_hotspot_token, hotspots_input) if token)
+    return ""
 
-            chain = hotspot.get("chain") or hotspot.get("auth_chain") or hotspot.get("chain_id") or "T"
-            residue_id = (
-                hotspot.get("resi")
-                or hotspot.get("label_seq_id")
-                or hotspot.get("present_seq_id")
-                or hotspot.get("auth_seq_id")
-                or hotspot.get("seq_id")
-            )
-            if chain and residue_id is not None:
-                tokens.append(f"{chain}{residue_id}")
-    return ",".join(tokens)
+
+def _design_loop_token(loop: Any) -> Optional[str]:
+    if isinstance(loop, str):
+        return loop
+    name = str(loop.get("cdr_name") or loop.get("name") or "loop")
+    start = loop.get("label_seq_id_start") or loop.get("start")
+    end = loop.get("label_seq_id_end") or loop.get("end")
+    if start is not None and end is not None:
+        return f"{name}:{start}-{end}"
+    return None
 
 
 def _format_design_loops_for_rf(design_loops_input: Any, cdr_mapping_json: Any = None) -> str:
@@ -208,28 +381,17 @@ def _format_design_loops_for_rf(design_loops_input: Any, cdr_mapping_json: Any =
         if isinstance(design_loops_input, str):
             return design_loops_input
         if isinstance(design_loops_input, (list, tuple)):
-            normalized: List[str] = []
-            for loop in design_loops_input:
-                if isinstance(loop, str):
-                    normalized.append(loop)
-                    continue
-                name = str(loop.get("cdr_name") or loop.get("name") or "loop")
-                start = loop.get("label_seq_id_start") or loop.get("start")
-                end = loop.get("label_seq_id_end") or loop.get("end")
-                if start is not None and end is not None:
-                    normalized.append(f"{name}:{start}-{end}")
-            return ",".join(normalized)
+            return ",".join(token for token in map(_design_loop_token, design_loops_input) if token)
 
     if cdr_mapping_json:
-        tokens: List[str] = []
-        for cdr in cdr_mapping_json.get("cdr_mappings", []):
-            if cdr.get("status") == "mapped":
-                name = cdr.get("cdr_name")
-                start = cdr.get("label_seq_id_start")
-                end = cdr.get("label_seq_id_end")
-                if name and start is not None and end is not None:
-                    tokens.append(f"{name}:{start}-{end}")
-        return ",".join(tokens)
+        return ",".join(
+            f"{name}:{start}-{end}"
+            for cdr in cdr_mapping_json.get("cdr_mappings", [])
+            if cdr.get("status") == "mapped"
+            and (name := cdr.get("cdr_name"))
+            and (start := cdr.get("label_seq_id_start")) is not None
+            and (end := cdr.get("label_seq_id_end")) is not None
+        )
 
     return ""
 
@@ -243,14 +405,50 @@ def _collect_outputs(output_dir: Path) -> Dict[str, object]:
     if not output_dir.exists():
         return artifacts
 
-    designs = sorted(output_dir.glob("*.pdb"))
-    metrics = sorted(output_dir.glob("*.csv"))
+    # one readdir pass instead of two globs over a directory that can hold
+    # tens of thousands of designs
+    designs: List[str] = []
+    metrics: List[str] = []
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".pdb"):
+                designs.append(entry.path)
+            elif name.endswith(".csv"):
+                metrics.append(entry.path)
+    designs.sort()
+    metrics.sort()
     if designs:
-        artifacts["design_pdbs"] = [str(path) for path in designs]
+        artifacts["design_pdbs"] = designs
     if metrics:
-        artifacts["metrics_csv"] = [str(path) for path in metrics]
+        artifacts["metrics_csv"] = metrics
 
     summary_path = output_dir / "rfantibody_outputs.json"
-    summary_path.write_text(json.dumps(artifacts, indent=2))
+    _write_artifact_summary(summary_path, designs, metrics)
     artifacts["summary_json"] = str(summary_path)
     return artifacts
+
+
+def _write_artifact_summary(summary_path: Path, designs: List[str], metrics: List[str]) -> None:
+    """Write the outputs summary incrementally, one path at a time.
+
+    Runs producing thousands of designs would otherwise pay for one JSON
+    string the size of the whole listing before a single byte hits disk.
+    """
+
+    encode = orjson.dumps if orjson is not None else (lambda value: json.dumps(value).encode())
+    with summary_path.open("wb") as handle:
+        handle.write(b"{")
+        first_key = True
+        for key, values in (("design_pdbs", designs), ("metrics_csv", metrics)):
+            if not values:
+                continue
+            if not first_key:
+                handle.write(b",")
+            first_key = False
+            handle.write(b'\n  "' + key.encode() + b'": [')
+            for index, value in enumerate(values):
+                handle.write(b",\n    " if index else b"\n    ")
+                handle.write(encode(value))
+            handle.write(b"\n  ]")
+        handle.write(b"\n}" if not first_key else b"}")
@@ -1,5 +1,13 @@
 """Pipeline package for running prediction workflows."""
 
-from .cdr import annotate_cdrs
-
 __all__ = ["annotate_cdrs"]
+
+
+def __getattr__(name):
+    # PEP 562 lazy export: importing pipeline.runner (or the package itself)
+    # should not pull in the annotation stack until someone asks for it.
+    if name == "annotate_cdrs":
+        from .cdr import annotate_cdrs
+
+        return annotate_cdrs
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
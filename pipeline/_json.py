@@ -0,0 +1,45 @@
+"""Shared JSON serialization helpers for pipeline artifact writers."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# shared stdlib encoder: skips per-call encoder construction and the
+# circular-reference bookkeeping our plain dict/list payloads never need
+_JSON_ENCODER = json.JSONEncoder(indent=2, separators=(",", ": "), check_circular=False, ensure_ascii=False)
+
+_ORJSON_OPTS = (
+    (orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    if orjson is not None
+    else 0
+)
+
+
+def dumps_bytes(payload: Any) -> bytes:
+    """Serialize to indented JSON bytes, preferring the C-level encoder."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=_ORJSON_OPTS, default=str)
+    return "".join(_JSON_ENCODER.iterencode(payload)).encode()
+
+
+def dump_path(path: Path, payload: Any) -> None:
+    """Write indented JSON to ``path`` without building an intermediate str.
+
+    The stdlib fallback streams encoder chunks through a buffered handle so
+    large payloads (mappings with tens of thousands of residues) never hold
+    both the object tree and its full text in memory at once.
+    """
+
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=_ORJSON_OPTS, default=str))
+    else:
+        with path.open("w", buffering=1 << 20) as handle:
+            for chunk in _JSON_ENCODER.iterencode(payload):
+                handle.write(chunk)
@@ -8,28 +8,227 @@ for API consumers.
 """
 from __future__ import annotations
 
-import csv
+import functools
+import hashlib
+import importlib.util
 import json
 import logging
+import mmap
+import os
+import shutil
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Optional
 from types import SimpleNamespace
 
 try:  # pragma: no cover - optional dependency
-    from abnumber import Chain
+    import numpy as np
 except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    Chain = None
+    np = None
 
 try:  # pragma: no cover - optional dependency
-    from Bio.PDB import MMCIFParser, PDBParser, PPBuilder
+    import orjson
 except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    MMCIFParser = None
-    PDBParser = None
-    PPBuilder = None
+    orjson = None
 
 LOGGER = logging.getLogger(__name__)
 
+# abnumber and gemmi are imported on first use rather than at module top:
+# abnumber runs ANARCI package setup and gemmi drags in its whole extension
+# module, and entrypoints that never annotate should not pay for either.
+_CHAIN_CLS: Any = None
+_CHAIN_RESOLVED = False
+_GEMMI: Any = None
+_GEMMI_RESOLVED = False
+
+
+def _chain_class() -> Any:
+    global _CHAIN_CLS, _CHAIN_RESOLVED
+    if not _CHAIN_RESOLVED:
+        _CHAIN_RESOLVED = True
+        try:  # pragma: no cover - optional dependency
+            from abnumber import Chain
+
+            _CHAIN_CLS = Chain
+        except ModuleNotFoundError:  # pragma: no cover - optional dependency
+            _CHAIN_CLS = None
+    return _CHAIN_CLS
+
+
+def _gemmi() -> Any:
+    global _GEMMI, _GEMMI_RESOLVED
+    if not _GEMMI_RESOLVED:
+        _GEMMI_RESOLVED = True
+        try:  # pragma: no cover - optional dependency
+            import gemmi
+
+            _GEMMI = gemmi
+        except ModuleNotFoundError:  # pragma: no cover - optional dependency
+            _GEMMI = None
+    return _GEMMI
+
+
+# On-disk cache for annotation payloads, keyed by sequence content. ANARCI/HMMER
+# numbering is by far the most expensive step here, and iterative design runs
+# re-annotate the same frameworks over and over.
+_CDR_CACHE_DIR = Path.home() / ".cache" / "abdesign" / "cdr"
+
+# The numbering backend loads its HMM model lazily inside the first Chain
+# construction. Pre-warming runs that load on a daemon thread so it overlaps
+# with structure parsing; the lock serializes Chain calls since the backend
+# is not known to be thread-safe.
+_CHAIN_LOCK = threading.Lock()
+_WARM_STARTED = False
+_WARM_SEQUENCE = (
+    "QVQLQESGGGLVQAGGSLRLSCAASGYTIGPYCMGWFRQAPGKEREGVAAINMGGGITYYADSVKGRFTI"
+    "SQDNAKNTVYLLMNSLEPEDTAIYYCAADSTIYASYYECGHGLSTGGYGYDSWGQGTQVTVSS"
+)
+
+
+_HMM_STAGED = False
+
+
+def _stage_hmm_database() -> None:
+    """Stage the ANARCI HMM database on tmpfs and pin HMMER to one thread.
+
+    Copies the HMM files to /dev/shm once per machine so cold invocations
+    never re-read them from disk, and caps HMMER's internal threading since
+    parallelism is better spent batching annotations. No-ops when anarci is
+    not installed, /dev/shm is unavailable, or the operator already set
+    ANARCI_HMMDIR.
+    """
+
+    global _HMM_STAGED
+    if _HMM_STAGED:
+        return
+    _HMM_STAGED = True
+
+    os.environ.setdefault("HMMER_NCPU", "1")
+    if os.environ.get("ANARCI_HMMDIR"):
+        return
+    shm = Path("/dev/shm")
+    if not shm.is_dir():
+        return
+
+    try:
+        spec = importlib.util.find_spec("anarci")
+        if spec is None or not spec.submodule_search_locations:
+            return
+        source = Path(next(iter(spec.submodule_search_locations))) / "dat" / "HMMs"
+        if not source.is_dir():
+            return
+        staged = shm / "abdesign-hmm"
+        if not staged.exists():
+            scratch = shm / f".abdesign-hmm.{os.getpid()}"
+            shutil.copytree(source, scratch)
+            try:
+                scratch.rename(staged)
+            except OSError:  # another process won the rename
+                shutil.rmtree(scratch, ignore_errors=True)
+        os.environ["ANARCI_HMMDIR"] = str(staged)
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.debug("Could not stage HMM database on tmpfs: %s", exc)
+
+
+def warm_numbering_backend() -> None:
+    """Kick off a background numbering run so the model is loaded early.
+
+    Call this at service startup (the worker does, before it starts taking
+    jobs) rather than from the annotation path itself: a warm run racing a
+    real annotation for ``_CHAIN_LOCK`` would only delay the real one.
+    """
+
+    global _WARM_STARTED
+    if _WARM_STARTED or _chain_class() is None:
+        return
+    _WARM_STARTED = True
+    _stage_hmm_database()
+
+    def _warm() -> None:
+        if _CHAIN_LOCK.locked():
+            # a real annotation already owns the backend; its own numbering
+            # call loads the model, so warming now would just add contention
+            return
+        try:
+            _annotate_cached(_WARM_SEQUENCE, "chothia", "H")
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.debug("Numbering backend pre-warm failed: %s", exc)
+
+    threading.Thread(target=_warm, name="cdr-numbering-prewarm", daemon=True).start()
+
+
+# 3-letter to 1-letter codes for the standard amino acids, used by the
+# vectorized PDB sequence extractor.
+_AA3_TO_1 = {
+    "ALA": "A", "ARG": "R", "ASN": "N", "ASP": "D", "CYS": "C",
+    "GLN": "Q", "GLU": "E", "GLY": "G", "HIS": "H", "ILE": "I",
+    "LEU": "L", "LYS": "K", "MET": "M", "PHE": "F", "PRO": "P",
+    "SER": "S", "THR": "T", "TRP": "W", "TYR": "Y", "VAL": "V",
+}
+
+
+def _build_aa3_table():
+    """17576-entry lookup of one-letter codes indexed by packed A-Z triples.
+
+    Lets the vectorized extractor translate every residue name with one
+    np.take instead of a per-residue dict lookup; zero marks non-amino-acid
+    codes so they can be dropped in bulk.
+    """
+
+    if np is None:
+        return None
+    table = np.zeros(26 * 26 * 26, dtype=np.uint8)
+    for three, one in _AA3_TO_1.items():
+        index = (ord(three[0]) - 65) * 676 + (ord(three[1]) - 65) * 26 + (ord(three[2]) - 65)
+        table[index] = ord(one)
+    return table
+
+
+_AA3_TABLE = _build_aa3_table()
+
+# Below this size the NumPy boolean-mask scan wins; above it a compiled
+# single-pass kernel avoids materializing the newline and mask temporaries.
+_NUMBA_MIN_BYTES = 4 << 20
+_NUMBA_KERNEL = None
+_NUMBA_CHECKED = False
+
+
+def _get_numba_kernel():
+    """Compile the ATOM-record scanner on first use, if numba is installed."""
+
+    global _NUMBA_KERNEL, _NUMBA_CHECKED
+    if not _NUMBA_CHECKED:
+        _NUMBA_CHECKED = True
+        try:  # pragma: no cover - optional dependency
+            from numba import njit
+        except ModuleNotFoundError:  # pragma: no cover - optional dependency
+            return None
+
+        @njit(cache=True)
+        def _atom_starts(buf):  # pragma: no cover - compiled path
+            n = buf.size
+            out = np.empty(n // 28 + 1, np.int64)
+            count = 0
+            start = 0
+            for i in range(n + 1):
+                if i == n or buf[i] == 10:
+                    if (
+                        i - start >= 27
+                        and buf[start] == 65      # A
+                        and buf[start + 1] == 84  # T
+                        and buf[start + 2] == 79  # O
+                        and buf[start + 3] == 77  # M
+                        and (buf[start + 16] == 32 or buf[start + 16] == 65)
+                    ):
+                        out[count] = start
+                        count += 1
+                    start = i + 1
+            return out[:count]
+
+        _NUMBA_KERNEL = _atom_starts
+    return _NUMBA_KERNEL
+
 
 @dataclass
 class CDRArtifacts:
@@ -58,7 +257,7 @@ def annotate_cdrs(
     json_path = output_dir / "cdr_annotations.json"
     csv_path = output_dir / "cdr_annotations.csv"
 
-    if Chain is None:
+    if _chain_class() is None:
         payload = {
             "status": "failed",
             "reason": "abnumber is not installed; skipping CDR annotation",
@@ -68,7 +267,7 @@ def annotate_cdrs(
             "cdrs": [],
             "numbering": [],
         }
-        json_path.write_text(json.dumps(payload, indent=2))
+        _write_json(json_path, payload)
         csv_path.write_text("name,start,end,length,sequence\n")
         return payload
 
@@ -84,28 +283,12 @@ def annotate_cdrs(
             "cdrs": {},
             "numbering": [],
         }
-        json_path.write_text(json.dumps(payload, indent=2))
+        _write_json(json_path, payload)
         csv_path.write_text("name,start,end,length,sequence\n")
         return payload
 
-    cdr_segments: List[Dict[str, Any]] = []
-    numbering_labels: List[str] = []
     try:
-        # Force use_anarcii=True because anarci is not available in this environment
-        chain = Chain(sequence, scheme=scheme, use_anarcii=True)
-
-        numbering_source = getattr(chain, "numbering", getattr(chain, "positions", []))
-        numbering_labels = [_position_label(pos) for pos in numbering_source]
-        cdr_segments = _collect_cdrs(chain)
-
-        payload = {
-            "status": "succeeded",
-            "scheme": scheme,
-            "chain_type": chain_type,
-            "sequence": sequence,
-            "numbering": numbering_labels,
-            "cdrs": cdr_segments,
-        }
+        payload = json.loads(_annotate_cached(sequence, scheme, chain_type))
     except Exception as exc:  # noqa: BLE001
         payload = {
             "status": "failed",
@@ -117,70 +300,311 @@ def annotate_cdrs(
             "numbering": [],
         }
 
-    json_path.write_text(json.dumps(payload, indent=2))
-    _write_cdr_csv(csv_path, cdr_segments)
+    _write_json(json_path, payload)
+    _write_cdr_csv(csv_path, payload.get("cdrs", []))
 
     return payload
 
 
+@functools.lru_cache(maxsize=4096)
+def _annotate_cached(sequence: str, scheme: str, chain_type: str) -> str:
+    """Run numbering for a sequence, memoized in process and on disk.
+
+    Identical sequences hit the lru cache within a process and the
+    ``~/.cache/abdesign/cdr`` directory across processes, so each unique
+    sequence pays for exactly one HMMER launch. Only successful payloads are
+    cached; failures propagate to the caller unrecorded. Returns the payload
+    as a JSON string so cache hits hand each caller an independent dict.
+    """
+
+    digest = hashlib.sha1(f"{scheme}|{chain_type}|{sequence}".encode("ascii", "replace")).hexdigest()
+    cache_path = _CDR_CACHE_DIR / f"{digest}.json"
+    try:
+        return cache_path.read_text()
+    except OSError:
+        pass
+
+    # Force use_anarcii=True because anarci is not available in this environment
+    chain_cls = _chain_class()
+    with _CHAIN_LOCK:
+        chain = chain_cls(sequence, scheme=scheme, use_anarcii=True)
+    serialized = json.dumps(_chain_payload(chain, sequence, scheme, chain_type))
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(serialized)
+    except OSError as exc:  # noqa: BLE001
+        LOGGER.debug("Could not persist CDR annotation cache entry: %s", exc)
+    return serialized
+
+
+def annotate_cdrs_batch(
+    sequences: Mapping[str, str],
+    scheme: str = "chothia",
+    chain_type: str = "H",
+) -> Dict[str, Mapping[str, Any]]:
+    """Annotate several sequences with a single batched numbering run.
+
+    Constructing ``abnumber.Chain`` objects one at a time pays the HMMER
+    startup cost per sequence; when upstream exposes ``Chain.batch`` all
+    sequences go through one ANARCI invocation instead. The returned mapping
+    mirrors the per-sequence payload shape of :func:`annotate_cdrs` keyed by
+    the caller-supplied names.
+    """
+
+    if _chain_class() is None:
+        reason = "abnumber is not installed; skipping CDR annotation"
+        return {
+            name: {
+                "status": "failed",
+                "reason": reason,
+                "scheme": scheme,
+                "chain_type": chain_type,
+                "sequence": sequence,
+                "cdrs": [],
+                "numbering": [],
+            }
+            for name, sequence in sequences.items()
+        }
+
+    chains, errors = _build_chains_batched(sequences, scheme)
+
+    payloads: Dict[str, Mapping[str, Any]] = {}
+    for name, sequence in sequences.items():
+        chain = chains.get(name)
+        if chain is not None:
+            payloads[name] = _chain_payload(chain, sequence, scheme, chain_type)
+        else:
+            payloads[name] = {
+                "status": "failed",
+                "reason": str(errors.get(name, "numbering failed")),
+                "scheme": scheme,
+                "chain_type": chain_type,
+                "sequence": sequence,
+                "cdrs": [],
+                "numbering": [],
+            }
+    return payloads
+
+
+def _build_chains_batched(sequences: Mapping[str, str], scheme: str) -> tuple[Dict[str, Any], Dict[str, Any]]:
+    """Build chains for all sequences, batched through ANARCI when supported."""
+
+    chain_cls = _chain_class()
+    batch = getattr(chain_cls, "batch", None)
+    if callable(batch):
+        try:
+            result = batch(dict(sequences), scheme=scheme)
+            if isinstance(result, tuple):
+                chains, errors = result
+            else:
+                chains, errors = result, {}
+            return dict(chains), dict(errors)
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("Batched numbering failed; falling back to per-sequence calls: %s", exc)
+
+    chains: Dict[str, Any] = {}
+    errors: Dict[str, Any] = {}
+    for name, sequence in sequences.items():
+        try:
+            with _CHAIN_LOCK:
+                chains[name] = chain_cls(sequence, scheme=scheme, use_anarcii=True)
+        except Exception as exc:  # noqa: BLE001
+            errors[name] = exc
+    return chains, errors
+
+
+def _chain_payload(chain: Any, sequence: str, scheme: str, chain_type: str) -> Dict[str, Any]:
+    numbering_source = getattr(chain, "numbering", getattr(chain, "positions", []))
+    return {
+        "status": "succeeded",
+        "scheme": scheme,
+        "chain_type": chain_type,
+        "sequence": sequence,
+        "numbering": [_position_label(pos) for pos in numbering_source],
+        "cdrs": _collect_cdrs(chain),
+    }
+
+
 def _extract_sequence(structure_path: Path, chain_id: Optional[str]) -> str:
-    if PPBuilder is None:
-        raise ValueError("Biopython is required to extract sequences for CDR annotation")
+    fast_sequence = _extract_sequence_vectorized(structure_path, chain_id)
+    if fast_sequence:
+        return fast_sequence
 
-    parser = _select_parser(structure_path)
-    structure = parser.get_structure("query", str(structure_path))
+    gemmi = _gemmi()
+    if gemmi is None:
+        raise ValueError("gemmi is required to extract sequences for CDR annotation")
 
-    chain = _select_chain(structure, chain_id)
-    peptides = PPBuilder().build_peptides(chain)
-    if not peptides:
-        raise ValueError(f"No polypeptide chains found in {structure_path}")
+    structure = gemmi.read_structure(str(structure_path))
+    if not len(structure):
+        raise ValueError(f"No models found in {structure_path}")
 
-    sequence = str(peptides[0].get_sequence())
+    chain = _select_chain(structure[0], chain_id)
+    sequence = _sequence_from_chain(chain)
     if not sequence:
-        raise ValueError(f"Empty sequence extracted from {structure_path}")
+        raise ValueError(f"No polypeptide chains found in {structure_path}")
     return sequence
 
 
-def _select_parser(structure_path: Path):
-    if PDBParser is None:
-        raise ValueError("Biopython is required to parse structures for CDR annotation")
-    suffix = structure_path.suffix.lower()
-    if suffix == ".cif":
-        return MMCIFParser(QUIET=True)
-    return PDBParser(QUIET=True)
+def _extract_sequence_vectorized(structure_path: Path, chain_id: Optional[str]) -> Optional[str]:
+    """Fast-path sequence extraction for fixed-width PDB files via NumPy.
 
+    Reshapes the raw bytes into a 2D line array and masks/slices the ATOM
+    record columns in a few vectorized passes instead of running a Python
+    loop per line. Returns None (so the caller falls back to the Biopython
+    parser) when NumPy is unavailable, the file is not plain fixed-width PDB,
+    or anything about the record layout looks unusual.
+    """
+
+    if np is None or structure_path.suffix.lower() not in {".pdb", ".ent"}:
+        return None
 
-def _select_chain(structure, chain_id: Optional[str]):
-    chains = list(structure.get_chains())
+    try:
+        # Memory-map rather than read: the column gathers below only touch a
+        # handful of bytes per line, so no full-file copy is ever made.
+        with structure_path.open("rb") as handle:
+            try:
+                data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):  # empty file or mmap-unfriendly filesystem
+                data = handle.read()
+        if not len(data):
+            return None
+
+        buf = np.frombuffer(data, dtype=np.uint8)
+        starts = None
+        if buf.size >= _NUMBA_MIN_BYTES:
+            kernel = _get_numba_kernel()
+            if kernel is not None:
+                starts = kernel(buf)
+        if starts is None:
+            newlines = np.flatnonzero(buf == ord("\n"))
+            if not newlines.size or newlines[-1] != buf.size - 1:
+                newlines = np.append(newlines, buf.size)
+            starts = np.concatenate(([0], newlines[:-1] + 1))
+            starts = starts[(newlines - starts) >= 27]
+            if not starts.size:
+                return None
+
+            # mask ATOM records with blank/primary altlocs via column gathers
+            mask = (
+                (buf[starts] == ord("A"))
+                & (buf[starts + 1] == ord("T"))
+                & (buf[starts + 2] == ord("O"))
+                & (buf[starts + 3] == ord("M"))
+            )
+            altlocs = buf[starts + 16]
+            mask &= (altlocs == ord(" ")) | (altlocs == ord("A"))
+            starts = starts[mask]
+        if not starts.size:
+            return None
+
+        chains = buf[starts + 21]
+        if chain_id:
+            if len(chain_id) != 1:
+                return None
+            starts = starts[chains == ord(chain_id)]
+            if not starts.size:
+                raise ValueError(f"Chain {chain_id} not found in structure")
+        elif (chains != chains[0]).any():
+            LOGGER.warning("Multiple chains present; defaulting to first chain %s", chr(int(chains[0])))
+            starts = starts[chains == chains[0]]
+
+        # unique residues in order of first appearance, keyed on the packed
+        # seq-id + insertion-code columns (22-26)
+        residue_keys = np.zeros(starts.size, dtype=np.int64)
+        for offset in range(22, 27):
+            residue_keys = (residue_keys << 8) | buf[starts + offset].astype(np.int64)
+        _, first_indices = np.unique(residue_keys, return_index=True)
+        first_indices.sort()
+
+        # translate residue names with one gather through the packed table;
+        # non A-Z bytes and unknown codes resolve to zero and are dropped
+        resname_starts = starts[first_indices] + 17
+        chars = np.stack(
+            [buf[resname_starts], buf[resname_starts + 1], buf[resname_starts + 2]]
+        ).astype(np.int32) - 65
+        alphabetic = ((chars >= 0) & (chars < 26)).all(axis=0)
+        indices = chars[0] * 676 + chars[1] * 26 + chars[2]
+        codes = np.where(alphabetic, np.take(_AA3_TABLE, np.where(alphabetic, indices, 0)), 0)
+        return codes[codes != 0].tobytes().decode("ascii")
+    except ValueError:
+        raise
+    except Exception as exc:  # noqa: BLE001
+        LOGGER.debug("Vectorized PDB sequence extraction failed; falling back: %s", exc)
+        return None
+
+
+def _select_chain(model, chain_id: Optional[str]):
+    chains = list(model)
     if not chains:
         raise ValueError("No chains found in structure")
 
     if chain_id:
         for chain in chains:
-            if chain.id.strip() == chain_id:
+            if chain.name.strip() == chain_id:
                 return chain
         raise ValueError(f"Chain {chain_id} not found in structure")
 
     if len(chains) > 1:
-        LOGGER.warning("Multiple chains present; defaulting to first chain %s", chains[0].id)
+        LOGGER.warning("Multiple chains present; defaulting to first chain %s", chains[0].name)
     return chains[0]
 
 
+def _sequence_from_chain(chain) -> str:
+    """One-letter sequence from a gemmi chain, deduped on seq id + icode."""
+
+    letters: List[str] = []
+    seen: set = set()
+    for residue in chain:
+        # pack seq id + insertion code into one int: small ints hash as
+        # themselves, so membership checks skip the tuple allocation and
+        # string hashing of a (num, icode) key
+        seqid = residue.seqid
+        key = (seqid.num << 8) | ord(seqid.icode or " ")
+        if key in seen:
+            continue
+        seen.add(key)
+        letter = _AA3_TO_1.get(residue.name.upper())
+        if letter is None:
+            info = _gemmi().find_tabulated_residue(residue.name)
+            if info is not None and info.is_amino_acid():
+                letter = info.one_letter_code.upper()
+        if letter:
+            letters.append(letter)
+    return "".join(letters)
+
+
+_POS_FN = None
+
+
+def _choose_pos_fn(position: Any):
+    """Pick the label accessor for AbNumber position objects once.
+
+    The positions handed to us all share one class per run, so the
+    attribute probing only needs to happen for the first instance; after
+    that every label is a single direct call.
+    """
+
+    for attr in ("label", "to_str"):
+        value = getattr(position, attr, None)
+        if callable(value):
+            return lambda pos, _attr=attr: str(getattr(pos, _attr)())
+        if value is not None:
+            return lambda pos, _attr=attr: str(getattr(pos, _attr))
+    return str
+
+
 def _position_label(position: Any) -> str:
     """Convert AbNumber position objects to stable string labels."""
 
+    global _POS_FN
     if position is None:
         return ""
-    for attr in ("label", "to_str", "__str__"):
-        value = getattr(position, attr, None)
-        if callable(value):
-            try:
-                return str(value())
-            except Exception:  # noqa: BLE001
-                continue
-        if value is not None:
-            return str(value)
-    return str(position)
+    if _POS_FN is None:
+        _POS_FN = _choose_pos_fn(position)
+    try:
+        return _POS_FN(position)
+    except Exception:  # noqa: BLE001
+        return str(position)
 
 
 def _collect_cdrs(chain: Any) -> List[Dict[str, Any]]:
@@ -235,39 +659,39 @@ def _extract_region_sequence(region: Any) -> str:
 
 
 def _extract_region_positions(region: Any) -> List[Dict[str, str]]:
-    positions: List[Dict[str, str]] = []
     residues = getattr(region, "residues", None)
     if residues is None:
         residues = getattr(region, "residue_numbers", None)
-
     if residues is None:
-        return positions
+        return []
+
+    residues = list(residues)
+    labels = [_position_label(getattr(residue, "position", None)) for residue in residues]
+    aas = [getattr(residue, "aa", None) for residue in residues]
+    return [{"position": label or "", "aa": aa or ""} for label, aa in zip(labels, aas)]
+
 
-    for residue in residues:
-        label = None
-        aa = None
-        if hasattr(residue, "position"):
-            label = _position_label(getattr(residue, "position"))
-        if hasattr(residue, "aa"):
-            aa = getattr(residue, "aa")
-        positions.append({"position": label or "", "aa": aa or ""})
-    return positions
+def _write_json(destination: Path, payload: Mapping[str, Any]) -> None:
+    """Serialize a payload with orjson when available, stdlib json otherwise."""
+
+    if orjson is not None:
+        destination.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        destination.write_text(json.dumps(payload, indent=2))
 
 
 def _write_cdr_csv(destination: Path, cdr_segments: Iterable[Mapping[str, Any]]) -> None:
-    with destination.open("w", newline="") as handle:
-        writer = csv.DictWriter(
-            handle,
-            fieldnames=["name", "start", "end", "length", "sequence"],
+    # CDR names and sequences never contain commas or quotes, so a plain
+    # buffered join beats csv.DictWriter's per-row dict handling
+    rows = [b"name,start,end,length,sequence\n"]
+    for segment in cdr_segments:
+        fields = (
+            segment.get("name"),
+            segment.get("start"),
+            segment.get("end"),
+            segment.get("length"),
+            segment.get("sequence"),
         )
-        writer.writeheader()
-        for segment in cdr_segments:
-            writer.writerow(
-                {
-                    "name": segment.get("name"),
-                    "start": segment.get("start"),
-                    "end": segment.get("end"),
-                    "length": segment.get("length"),
-                    "sequence": segment.get("sequence"),
-                }
-            )
+        line = ",".join("" if field is None else str(field) for field in fields)
+        rows.append(line.encode() + b"\n")
+    destination.write_bytes(b"".join(rows))
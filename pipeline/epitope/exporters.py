@@ -1,25 +1,27 @@
 """Export helpers for hotspot interoperability."""
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
 
 from pipeline.epitope.mapping import ResolvedHotspotV2
 from pipeline.epitope.spec import ResidueRefAuth, ResidueRefCanonical
 
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    np = None
+
+# below this many hotspots per chain, sorted() beats the array round-trip
+_NUMPY_SORT_MIN = 64
+
 
 def export_rfantibody_hotspots(auth_hotspots: Sequence[ResidueRefAuth], chain_map: Mapping[str, str] | None = None) -> str:
     """Return RFantibody-formatted hotspot string."""
 
-    def _map_chain(chain: str) -> str:
-        if chain_map:
-            return chain_map.get(chain, chain)
-        return chain
-
-    tokens: List[str] = []
-    for hotspot in auth_hotspots:
-        mapped_chain = _map_chain(hotspot.chain)
-        suffix = hotspot.ins or ""
-        tokens.append(f"{mapped_chain}{hotspot.resi}{suffix}")
+    # bind the lookup once instead of re-checking chain_map per hotspot
+    get = (chain_map or {}).get
+    tokens = [f"{get(h.chain, h.chain)}{h.resi}{h.ins or ''}" for h in auth_hotspots]
     return f"ppi.hotspot_res=[{','.join(tokens)}]"
 
 
@@ -41,14 +43,19 @@ def export_boltzgen_binding(
 ) -> Dict[str, List[Dict[str, Dict[str, str]]]]:
     """Convert canonical hotspots into BoltzGen binding dictionary using present_seq_id numbering."""
 
-    per_chain: Dict[str, List[int]] = {}
+    per_chain: Dict[str, List[int]] = defaultdict(list)
     for hotspot in resolved_canonical_hotspots:
         chain, seq_id = _extract_canonical_id(hotspot)
-        per_chain.setdefault(chain, []).append(seq_id)
+        per_chain[chain].append(seq_id)
 
     binding_types = []
     for chain, seq_ids in per_chain.items():
-        seq_ids_sorted = sorted(seq_ids)
-        binding_types.append({"chain": {"id": chain, "binding": ",".join(map(str, seq_ids_sorted))}})
+        if np is not None and len(seq_ids) >= _NUMPY_SORT_MIN:
+            arr = np.fromiter(seq_ids, dtype=np.int32, count=len(seq_ids))
+            arr.sort()
+            seq_ids = arr.tolist()
+        else:
+            seq_ids = sorted(seq_ids)
+        binding_types.append({"chain": {"id": chain, "binding": ",".join(map(str, seq_ids))}})
 
     return {"binding_types": binding_types}
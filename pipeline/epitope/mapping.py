@@ -2,18 +2,26 @@
 from __future__ import annotations
 
 import datetime as _dt
-import json
-from dataclasses import asdict, dataclass
+import functools
+import importlib.util
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Mapping, MutableMapping, Optional, Sequence, Tuple
 
+from pipeline._json import dump_path as _dump_json_path
 from pipeline.epitope.standardize import StandardizedStructure
 from pipeline.epitope.spec import ResidueRefAuth
 
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    np = None
+
 _SCOPE_ALLOWED = {
-    "protein": {"protein"},
-    "polymer": {"protein", "nucleic"},
-    "all": {"protein", "nucleic", "hetero", "water", "unknown"},
+    "protein": frozenset({"protein"}),
+    "polymer": frozenset({"protein", "nucleic"}),
+    "all": frozenset({"protein", "nucleic", "hetero", "water", "unknown"}),
 }
 
 
@@ -21,7 +29,17 @@ class MappingError(RuntimeError):
     """Raised when mapping cannot be completed."""
 
 
-@dataclass(frozen=True)
+def _dump_json(path: Path, payload: Dict[str, object]) -> None:
+    _dump_json_path(path, payload)
+
+
+def _auth_dict(ref: "ResidueRefAuth") -> Dict[str, object]:
+    # literal emission; dataclasses.asdict recurses and re-inspects fields
+    # on every call, which dominates to_dict for large mappings
+    return {"chain": ref.chain, "resi": ref.resi, "ins": ref.ins}
+
+
+@dataclass(frozen=True, slots=True)
 class MappingResidueV2:
     auth: ResidueRefAuth
     present_seq_id: int
@@ -32,7 +50,7 @@ class MappingResidueV2:
 
     def to_dict(self) -> Dict[str, object]:
         payload = {
-            "auth": asdict(self.auth),
+            "auth": _auth_dict(self.auth),
             "present_seq_id": self.present_seq_id,
             "mmcif_label": {"label_asym_id": self.label_asym_id, "label_seq_id": self.label_seq_id},
             "resname3": self.resname3,
@@ -48,20 +66,33 @@ class MappingResultV2:
     generated_at: str
 
     def __post_init__(self) -> None:
-        self._by_auth: Dict[Tuple[str, int, str], MappingResidueV2] = {
-            (res.auth.chain, res.auth.resi, res.auth.ins): res for res in self.residues
-        }
+        # build both indices in one pass; by_chain() used to rebuild its
+        # dict on every call even though residues never change after init
+        # pre-bucket by chain: structures have a handful of chains, so one
+        # cheap id pass lets the hot loop skip the missing-key branch
+        chain_ids = dict.fromkeys(res.auth.chain for res in self.residues)
+        by_chain: MutableMapping[str, List[MappingResidueV2]] = {chain: [] for chain in chain_ids}
+        by_auth: Dict[Tuple[str, int, str], MappingResidueV2] = {}
+        for res in self.residues:
+            auth = res.auth
+            by_auth[(auth.chain, auth.resi, auth.ins)] = res
+            by_chain[auth.chain].append(res)
+        self._by_auth = by_auth
+        self._by_chain = by_chain
+        self._dict_cache: Optional[Dict[str, object]] = None
 
     def get(self, ref: ResidueRefAuth) -> Optional[MappingResidueV2]:
         return self._by_auth.get((ref.chain, ref.resi, ref.ins))
 
     def by_chain(self) -> Mapping[str, List[MappingResidueV2]]:
-        chains: MutableMapping[str, List[MappingResidueV2]] = {}
-        for residue in self.residues:
-            chains.setdefault(residue.auth.chain, []).append(residue)
-        return chains
+        return self._by_chain
 
     def to_dict(self) -> Dict[str, object]:
+        # residues are fixed after init, so the (large) serialized form is
+        # built once and shared between write_json and summary embedding
+        if self._dict_cache is not None:
+            return self._dict_cache
+
         chains: List[Dict[str, object]] = []
         chain_residues = self.by_chain()
         for chain_id, residues in chain_residues.items():
@@ -74,7 +105,7 @@ class MappingResultV2:
                 }
             )
 
-        return {
+        self._dict_cache = {
             "mapping_schema_version": 2,
             "generated_at": self.generated_at,
             "source_structure": {
@@ -90,12 +121,13 @@ class MappingResultV2:
             },
             "chains": chains,
         }
+        return self._dict_cache
 
     def write_json(self, path: Path) -> None:
-        path.write_text(json.dumps(self.to_dict(), indent=2))
+        _dump_json(path, self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedHotspotV2:
     auth: ResidueRefAuth
     present_seq_id: Dict[str, object]
@@ -103,7 +135,7 @@ class ResolvedHotspotV2:
 
     def to_dict(self) -> Dict[str, object]:
         return {
-            "auth": asdict(self.auth),
+            "auth": _auth_dict(self.auth),
             "present_seq_id": self.present_seq_id,
             "mmcif_label": self.mmcif_label,
         }
@@ -115,18 +147,21 @@ class ResolveResultV2:
     normalized_auth: List[ResidueRefAuth]
     resolved: List[ResolvedHotspotV2]
     unmatched: List[Dict[str, object]]
+    _dict_cache: Optional[Dict[str, object]] = field(default=None, init=False, repr=False)
 
     def to_dict(self) -> Dict[str, object]:
-        return {
-            "schema_version": 2,
-            "input_hotspots": self.input_hotspots,
-            "normalized_auth": [asdict(ref) for ref in self.normalized_auth],
-            "resolved": [res.to_dict() for res in self.resolved],
-            "unmatched": self.unmatched,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "schema_version": 2,
+                "input_hotspots": self.input_hotspots,
+                "normalized_auth": [_auth_dict(ref) for ref in self.normalized_auth],
+                "resolved": [res.to_dict() for res in self.resolved],
+                "unmatched": self.unmatched,
+            }
+        return self._dict_cache
 
     def write_json(self, path: Path) -> None:
-        path.write_text(json.dumps(self.to_dict(), indent=2))
+        _dump_json(path, self.to_dict())
 
 
 def _require_gemmi():
@@ -137,14 +172,36 @@ def _require_gemmi():
     return gemmi
 
 
+_STANDARD_AA = frozenset({
+    "ALA", "ARG", "ASN", "ASP", "CYS", "GLN", "GLU", "GLY", "HIS", "ILE",
+    "LEU", "LYS", "MET", "PHE", "PRO", "SER", "THR", "TRP", "TYR", "VAL",
+    "ASX", "GLX", "UNK"
+})
+
+
+_MONOMER_TYPE_SETS: Optional[Tuple[set, set, set, object]] = None
+
+
+def _monomer_type_sets() -> Tuple[set, set, set, object]:
+    """Build the MonomerType classification sets once per process."""
+
+    global _MONOMER_TYPE_SETS
+    if _MONOMER_TYPE_SETS is None:
+        from gemmi import MonomerType  # type: ignore  # noqa: WPS433
+
+        protein_types = {getattr(MonomerType, name, None) for name in ("PeptideL", "PeptideD", "Peptide")}
+        nucleic_types = {getattr(MonomerType, name, None) for name in ("DNA", "RNA", "DNA_RNA")}
+        hetero_types = {getattr(MonomerType, name, None) for name in ("Saccharide", "Lipid", "NonPolymer", "Ion")}
+        water_type = getattr(MonomerType, "Water", object())
+        _MONOMER_TYPE_SETS = (protein_types, nucleic_types, hetero_types, water_type)
+    return _MONOMER_TYPE_SETS
+
+
+@functools.lru_cache(maxsize=None)
 def _monomer_category(resname: str) -> str:
-    # Fallback for standard amino acids
-    standard_aa = {
-        "ALA", "ARG", "ASN", "ASP", "CYS", "GLN", "GLU", "GLY", "HIS", "ILE",
-        "LEU", "LYS", "MET", "PHE", "PRO", "SER", "THR", "TRP", "TYR", "VAL",
-        "ASX", "GLX", "UNK"
-    }
-    if resname.upper() in standard_aa:
+    # Memoized per residue name: structures repeat a handful of codes
+    # thousands of times, so everything below runs once per unique name.
+    if resname.upper() in _STANDARD_AA:
         return "protein"
 
     gemmi = _require_gemmi()
@@ -157,17 +214,13 @@ def _monomer_category(resname: str) -> str:
     except Exception:  # noqa: BLE001
         return "unknown"
 
-    from gemmi import MonomerType  # type: ignore  # noqa: WPS433
-
-    protein_types = {getattr(MonomerType, name, None) for name in ("PeptideL", "PeptideD", "Peptide")}
-    nucleic_types = {getattr(MonomerType, name, None) for name in ("DNA", "RNA", "DNA_RNA")}
-    hetero_types = {getattr(MonomerType, name, None) for name in ("Saccharide", "Lipid", "NonPolymer", "Ion")}
+    protein_types, nucleic_types, hetero_types, water_type = _monomer_type_sets()
 
     if monomer_type in protein_types:
         return "protein"
     if monomer_type in nucleic_types:
         return "nucleic"
-    if monomer_type == getattr(MonomerType, "Water", object()):
+    if monomer_type == water_type:
         return "water"
     if monomer_type in hetero_types:
         return "hetero"
@@ -175,80 +228,135 @@ def _monomer_category(resname: str) -> str:
 
 
 def _collect_residue_rows(standardized_path: Path) -> List[Tuple[str, int, str, str, int, str]]:
-    gemmi = _require_gemmi()
     try:
-        block = gemmi.cif.read_file(str(standardized_path)).sole_block()
-    except Exception as exc:  # noqa: BLE001
+        stat = standardized_path.stat()
+    except OSError as exc:  # noqa: BLE001
         raise MappingError(f"failed to parse standardized structure {standardized_path}: {exc}") from exc
+    return _collect_residue_rows_cached(str(standardized_path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _collect_residue_rows_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> List[Tuple[str, int, str, str, int, str]]:
+    """Collect rows memoized on path + stat signature.
 
-    table = block.find_mmcif_category("_atom_site.")
-    if not table:
-        raise MappingError("standardized structure missing _atom_site loop for residue extraction")
+    Repeated mapping of the same standardized file (hotspot presets, rerun
+    pipelines) skips the parse entirely; the stat keys invalidate the entry
+    when the file is rewritten. Rows are plain tuples, so retaining a few
+    parses is cheap.
+    """
 
+    standardized_path = Path(path_str)
+    gemmi = _require_gemmi()
     try:
-        tags = list(table.tags)
-        label_seq_idx = tags.index("_atom_site.label_seq_id")
-        label_asym_idx = tags.index("_atom_site.label_asym_id")
-        auth_asym_idx = tags.index("_atom_site.auth_asym_id")
-        auth_seq_idx = tags.index("_atom_site.auth_seq_id")
-        ins_idx = tags.index("_atom_site.pdbx_PDB_ins_code")
-        resname_idx = tags.index("_atom_site.label_comp_id")
-    except ValueError as exc:  # noqa: BLE001
-        raise MappingError("standardized structure missing required atom site columns") from exc
+        structure = gemmi.read_structure(str(standardized_path))
+        structure.setup_entities()
+    except Exception as exc:  # noqa: BLE001
+        raise MappingError(f"failed to parse standardized structure {standardized_path}: {exc}") from exc
 
+    if not len(structure):
+        raise MappingError("no residues found in standardized structure")
+
+    # iterate the hierarchy residue by residue rather than walking every
+    # _atom_site row: one step per residue instead of one per atom
     seen: set[Tuple[str, int, str]] = set()
     rows: List[Tuple[str, int, str, str, int, str]] = []
-    for row in table:
-        auth_chain = row[auth_asym_idx].strip()
-        label_asym = row[label_asym_idx].strip()
-        resname = row[resname_idx].strip()
-        ins_raw = row[ins_idx].strip()
-        ins = "" if ins_raw in {"?", "."} else ins_raw
-
-        try:
-            if row[label_seq_idx] in {".", "?"}:
-                label_seq = int(row[auth_seq_idx])
-            else:
-                label_seq = int(row[label_seq_idx])
-            
-            auth_seq = int(row[auth_seq_idx])
-        except ValueError as exc:  # noqa: BLE001
-            raise MappingError("non-integer residue identifier encountered in standardized structure") from exc
-
-        key = (auth_chain, auth_seq, ins)
-        if key in seen:
-            continue
-        seen.add(key)
-        rows.append((auth_chain, auth_seq, ins, label_asym, label_seq, resname))
+    for chain in structure[0]:
+        # intern the small-alphabet identifiers once per row: the interned
+        # strings cache their hash, so the (chain, resi, ins) tuple keys in
+        # MappingResultV2._by_auth hash and compare on the fast path
+        auth_chain = sys.intern(chain.name)
+        for residue in chain:
+            auth_seq = residue.seqid.num
+            ins = sys.intern((residue.seqid.icode or "").strip())
+            key = (auth_chain, auth_seq, ins)
+            if key in seen:
+                continue
+            seen.add(key)
+            label_seq = residue.label_seq if residue.label_seq is not None else auth_seq
+            rows.append((auth_chain, auth_seq, ins, residue.subchain, label_seq, residue.name))
 
     if not rows:
         raise MappingError("no residues found in standardized structure")
     return rows
 
 
+# compiling the counter kernel only pays off for ribosome-scale structures
+_KERNEL_MIN_ROWS = 50_000
+
+_MAPPING_KERNEL = None
+_MAPPING_KERNEL_RESOLVED = False
+
+
+def _get_mapping_kernel():
+    """Return a compiled per-chain counter kernel, or None without numba."""
+
+    global _MAPPING_KERNEL, _MAPPING_KERNEL_RESOLVED
+    if _MAPPING_KERNEL_RESOLVED:
+        return _MAPPING_KERNEL
+    _MAPPING_KERNEL_RESOLVED = True
+    if np is None or importlib.util.find_spec("numba") is None:
+        return None
+
+    from numba import njit
+
+    @njit(cache=True)
+    def _present_counts(chain_idx, n_chains):  # pragma: no cover - compiled
+        counters = np.zeros(n_chains, np.int32)
+        out = np.empty(chain_idx.size, np.int32)
+        for i in range(chain_idx.size):
+            chain = chain_idx[i]
+            counters[chain] += 1
+            out[i] = counters[chain]
+        return out
+
+    _MAPPING_KERNEL = _present_counts
+    return _MAPPING_KERNEL
+
+
+def _present_seq_ids(auth_chains: Sequence[str]) -> Sequence[int]:
+    """Per-chain running counts (1-based) for the given chain of each row."""
+
+    if np is not None and len(auth_chains) >= _KERNEL_MIN_ROWS:
+        kernel = _get_mapping_kernel()
+        if kernel is not None:
+            codes, inverse = np.unique(np.asarray(auth_chains, dtype=object), return_inverse=True)
+            return kernel(inverse.astype(np.int32), codes.size).tolist()
+    # index the handful of distinct chains once so the counting pass does a
+    # single dict lookup plus a list-slot increment per row
+    index = {chain: i for i, chain in enumerate(dict.fromkeys(auth_chains))}
+    counters = [0] * len(index)
+    out: List[int] = []
+    for chain in auth_chains:
+        slot = index[chain]
+        count = counters[slot] + 1
+        counters[slot] = count
+        out.append(count)
+    return out
+
+
 def build_residue_mapping_v2(standardized: StandardizedStructure) -> MappingResultV2:
     rows = _collect_residue_rows(standardized.standardized_path)
-    chain_counters: Dict[str, int] = {}
+    present_ids = _present_seq_ids([row[0] for row in rows])
     residues: List[MappingResidueV2] = []
 
-    for auth_chain, auth_seq, ins, label_asym, label_seq, resname in rows:
-        chain_counters[auth_chain] = chain_counters.get(auth_chain, 0) + 1
-        category = _monomer_category(resname)
+    for (auth_chain, auth_seq, ins, label_asym, label_seq, resname), present in zip(rows, present_ids):
         residues.append(
             MappingResidueV2(
                 auth=ResidueRefAuth(chain=auth_chain, resi=auth_seq, ins=ins),
-                present_seq_id=chain_counters[auth_chain],
+                present_seq_id=present,
                 label_asym_id=label_asym,
                 label_seq_id=label_seq,
                 resname3=resname,
-                category=category,
+                category=_monomer_category(resname),
             )
         )
 
     return MappingResultV2(
         residues=residues,
         standardized=standardized,
-        generated_at=_dt.datetime.utcnow().isoformat() + "Z",
+        generated_at=_dt.datetime.now(_dt.timezone.utc).isoformat().replace("+00:00", "Z"),
     )
 
 
@@ -262,17 +370,22 @@ def resolve_hotspots_v2(
     unmatched: List[Dict[str, object]] = []
     chain_map = mapping.by_chain()
     input_tokens = [ref.token() for ref in auth_hotspots]
+    # hints are summarized once per chain, not once per missing hotspot
+    hint_cache: Dict[str, str] = {}
+    # 'all' admits every category, so its membership test is pure overhead
+    allowed = _SCOPE_ALLOWED[scope]
+    check_scope = scope != "all"
 
     for hotspot in auth_hotspots:
         mapping_residue = mapping.get(hotspot)
         if mapping_residue is None:
-            unmatched.append(_missing_residue_payload(hotspot, chain_map))
+            unmatched.append(_missing_residue_payload(hotspot, chain_map, hint_cache))
             continue
 
-        if mapping_residue.category not in _SCOPE_ALLOWED[scope]:
+        if check_scope and mapping_residue.category not in allowed:
             unmatched.append(
                 {
-                    "auth": asdict(hotspot),
+                    "auth": _auth_dict(hotspot),
                     "reason": "filtered_by_scope",
                     "hint": "Hotspot outside allowed scope; set hotspot_residue_scope='all' or 'polymer' to include it.",
                 }
@@ -295,16 +408,23 @@ def resolve_hotspots_v2(
     )
 
 
-def _missing_residue_payload(hotspot: ResidueRefAuth, chain_map: Mapping[str, List[MappingResidueV2]]):
-    chain_residues = chain_map.get(hotspot.chain)
-    if chain_residues:
-        auth_ids = [res.auth.resi for res in chain_residues]
-        hint = f"available auth resi range: {min(auth_ids)}-{max(auth_ids)}; check insertion codes"
-    else:
-        available_chains = ", ".join(sorted(chain_map.keys())) or "none"
-        hint = f"available chains: {available_chains}"
+def _missing_residue_payload(
+    hotspot: ResidueRefAuth,
+    chain_map: Mapping[str, List[MappingResidueV2]],
+    hint_cache: MutableMapping[str, str],
+):
+    hint = hint_cache.get(hotspot.chain)
+    if hint is None:
+        chain_residues = chain_map.get(hotspot.chain)
+        if chain_residues:
+            auth_ids = [res.auth.resi for res in chain_residues]
+            hint = f"available auth resi range: {min(auth_ids)}-{max(auth_ids)}; check insertion codes"
+        else:
+            available_chains = ", ".join(sorted(chain_map.keys())) or "none"
+            hint = f"available chains: {available_chains}"
+        hint_cache[hotspot.chain] = hint
     return {
-        "auth": asdict(hotspot),
+        "auth": _auth_dict(hotspot),
         "reason": "not_found_in_structure",
         "hint": hint,
     }
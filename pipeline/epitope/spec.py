@@ -1,11 +1,17 @@
 """Data structures and parsers for target hotspots."""
 from __future__ import annotations
 
+import functools
+import re
 from dataclasses import dataclass
 from typing import Any, List
 
+# chain, residue number, optional single-letter insertion code — one C-level
+# scan instead of the split/strip/isalpha cascade
+_TOKEN_RE = re.compile(r"\s*([^\s:]+)\s*:\s*(-?\d+)([A-Za-z]?)\s*")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ResidueRefAuth:
     """Reference to a residue using PDB auth identifiers."""
 
@@ -17,8 +23,13 @@ class ResidueRefAuth:
         suffix = self.ins or ""
         return f"{self.chain}:{self.resi}{suffix}".strip()
 
+    def as_dict(self) -> dict:
+        # literal emission; dataclasses.asdict deep-copies via reflection,
+        # which is overkill for three flat fields
+        return {"chain": self.chain, "resi": self.resi, "ins": self.ins}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResidueRefCanonical:
     """Reference to a residue using canonical 1-based sequence numbering."""
 
@@ -38,33 +49,21 @@ class HotspotSpec:
 def parse_hotspot_token(token: str) -> ResidueRefAuth:
     """Parse a hotspot token in the ``A:305`` or ``A:52A`` format."""
 
+    # type check before the cache: lru_cache hashes its argument first, and
+    # an unhashable token would surface as TypeError instead of ValueError
     if not isinstance(token, str):
         raise ValueError("hotspot token must be a string like 'A:305'")
 
-    if token.count(":") != 1:
-        raise ValueError("hotspot token must contain a single ':' separating chain and residue, e.g. 'A:305'")
-
-    chain_part, res_part = token.split(":")
-    chain = chain_part.strip()
-    if not chain:
-        raise ValueError("chain identifier in hotspot token cannot be empty")
+    return _parse_hotspot_token_cached(token)
 
-    res_part = res_part.strip()
-    if not res_part:
-        raise ValueError("residue portion of hotspot token cannot be empty")
 
-    number_str = res_part[:-1] if res_part[-1:].isalpha() else res_part
-    insertion = res_part[-1] if res_part[-1:].isalpha() else ""
+@functools.lru_cache(maxsize=1024)
+def _parse_hotspot_token_cached(token: str) -> ResidueRefAuth:
+    match = _TOKEN_RE.fullmatch(token)
+    if match is None:
+        raise ValueError("hotspot token must look like 'A:305' or 'A:52A' (chain, ':', residue index, optional insertion code)")
 
-    try:
-        resi = int(number_str)
-    except ValueError as exc:  # noqa: BLE001
-        raise ValueError("residue index must be an integer, e.g. '305' or '52A'") from exc
-
-    if insertion and len(insertion) != 1:
-        raise ValueError("insertion code must be a single character")
-
-    return ResidueRefAuth(chain=chain, resi=resi, ins=insertion)
+    return ResidueRefAuth(chain=match.group(1), resi=int(match.group(2)), ins=match.group(3))
 
 
 def _parse_hotspot_object(obj: Any) -> ResidueRefAuth:
@@ -101,18 +100,13 @@ def normalize_target_hotspots(raw: Any) -> List[ResidueRefAuth]:
     if not isinstance(raw, list):
         raise ValueError("target_hotspots must be a list of tokens like 'A:305' or dict entries")
 
-    normalized: List[ResidueRefAuth] = []
-    seen = set()
+    # one insertion-ordered dict does both dedup and ordering
+    normalized: dict = {}
     for entry in raw:
         if isinstance(entry, str):
             parsed = parse_hotspot_token(entry.strip())
         else:
             parsed = _parse_hotspot_object(entry)
+        normalized.setdefault((parsed.chain, parsed.resi, parsed.ins), parsed)
 
-        key = (parsed.chain, parsed.resi, parsed.ins)
-        if key in seen:
-            continue
-        seen.add(key)
-        normalized.append(parsed)
-
-    return normalized
+    return list(normalized.values())
@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 import datetime as _dt
+import functools
+import gzip
+import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict
@@ -40,64 +43,125 @@ def _detect_format(path: Path) -> str:
     )
 
 
-def _extract_chain_map(doc) -> Dict[str, str]:
-    block = doc.sole_block()
-    table = block.find_mmcif_category("_atom_site.")
-    if not table:
-        raise StructureStandardizationError("standardized structure missing _atom_site loop for chain mapping")
+@functools.lru_cache(maxsize=8)
+def _read_structure_cached(path_str: str, mtime_ns: int, size: int):
+    """Parse and set up a structure, memoized on path + stat signature.
 
-    try:
-        tags = list(table.tags)
-        auth_idx = tags.index("_atom_site.auth_asym_id")
-        label_idx = tags.index("_atom_site.label_asym_id")
-    except ValueError as exc:  # noqa: BLE001
-        raise StructureStandardizationError("standardized structure missing chain identifier columns") from exc
+    The mtime/size arguments only serve as cache-invalidation keys so an
+    edited file is re-read. Entity setup runs once here, so repeat
+    standardization of the same file skips both the parse and the setup.
+    """
+
+    gemmi = _require_gemmi()
+    structure = gemmi.read_structure(path_str)
+    structure.setup_entities()
+    structure.assign_label_seq_id()
+    return structure
+
+
+def _chain_map_from_structure(structure) -> Dict[str, str]:
+    """Build the auth→label chain map straight from the hierarchy.
+
+    Entity setup already assigned subchain (label_asym_id) names, so there
+    is no need to re-traverse the written mmCIF document's _atom_site loop.
+    """
 
     mapping: Dict[str, str] = {}
-    for row in table:
-        auth = row[auth_idx].strip()
-        label = row[label_idx].strip()
-        if auth and label and auth not in mapping:
-            mapping[auth] = label
+    for chain in structure[0]:
+        if chain.name in mapping or len(chain) == 0:
+            continue
+        subchain = chain[0].subchain
+        if subchain:
+            mapping[chain.name] = subchain
     if not mapping:
         raise StructureStandardizationError("no chain identifiers found in standardized structure")
     return mapping
 
 
-def standardize_structure(input_path: Path, out_dir: Path) -> StandardizedStructure:
-    """Read a PDB/mmCIF file and write a standardized mmCIF copy."""
+@functools.lru_cache(maxsize=32)
+def _standardize_cached(
+    path_str: str, mtime_ns: int, size: int, out_dir_str: str, input_format: str
+) -> StandardizedStructure:
+    """Standardize once per (input signature, output dir) combination.
 
-    gemmi = _require_gemmi()
-    input_path = Path(input_path)
-    if not input_path.exists():
-        raise StructureStandardizationError(f"structure file not found: {input_path}")
+    Multi-ligand pipelines standardize the same target for every run; the
+    memoized result skips both the gemmi parse and the mmCIF rewrite on
+    repeat calls. mtime/size key invalidation mirrors _read_structure_cached.
+    """
 
-    input_format = _detect_format(input_path)
+    out_dir = Path(out_dir_str)
+    standardized_path = out_dir / "standardized_target.cif"
+    sidecar_path = out_dir / "standardized_target.meta.json"
+    signature = [path_str, mtime_ns, size]
+
+    # cross-process fast path: a sidecar recording the input signature and
+    # the derived chain map lets a fresh process reuse the standardized file
+    # without parsing any structure at all
+    if standardized_path.exists() and sidecar_path.exists():
+        try:
+            meta = json.loads(sidecar_path.read_text())
+        except (OSError, ValueError):
+            meta = None
+        if meta and meta.get("input_signature") == signature:
+            return StandardizedStructure(
+                input_path=Path(path_str),
+                input_format=input_format,
+                standardized_path=standardized_path,
+                chain_id_map=dict(meta["chain_id_map"]),
+            )
 
     try:
-        structure = gemmi.read_structure(str(input_path))
+        structure = _read_structure_cached(path_str, mtime_ns, size)
+    except StructureStandardizationError:
+        raise
     except Exception as exc:  # noqa: BLE001
-        raise StructureStandardizationError(f"failed to parse structure {input_path}: {exc}") from exc
+        raise StructureStandardizationError(f"failed to parse structure {path_str}: {exc}") from exc
 
     if not structure:
-        raise StructureStandardizationError(f"structure {input_path} contains no models")
-
-    # Ensure entities are set up and label_seq_id is assigned
-    structure.setup_entities()
-    structure.assign_label_seq_id()
+        raise StructureStandardizationError(f"structure {path_str} contains no models")
 
     out_dir.mkdir(parents=True, exist_ok=True)
-    standardized_path = out_dir / "standardized_target.cif"
     doc = structure.make_mmcif_document()
-    # doc.ensure_block().set_software_list([], generated=_dt.datetime.utcnow())
-    doc.write_file(str(standardized_path))
+    # doc.ensure_block().set_software_list([], generated=_dt.datetime.now(_dt.timezone.utc))
+    cif_bytes = doc.as_string().encode()
+    standardized_path.write_bytes(cif_bytes)
+    # compressed copy for archival/transfer; mmCIF text compresses ~5-10x
+    # and gemmi reads .cif.gz transparently. The plain .cif stays canonical
+    # because external design tools consume it directly.
+    try:
+        with gzip.open(str(standardized_path) + ".gz", "wb", compresslevel=1) as handle:
+            handle.write(cif_bytes)
+    except OSError:  # pragma: no cover - sidecar is best-effort
+        pass
 
-    chain_map = _extract_chain_map(doc)
+    chain_map = _chain_map_from_structure(structure)
+    try:
+        sidecar_path.write_text(json.dumps({"input_signature": signature, "chain_id_map": chain_map}))
+    except OSError:  # pragma: no cover - sidecar is best-effort
+        pass
 
     return StandardizedStructure(
-        input_path=input_path,
+        input_path=Path(path_str),
         input_format=input_format,
         standardized_path=standardized_path,
         chain_id_map=chain_map,
     )
 
+
+def standardize_structure(input_path: Path, out_dir: Path) -> StandardizedStructure:
+    """Read a PDB/mmCIF file and write a standardized mmCIF copy."""
+
+    input_path = Path(input_path)
+    if not input_path.exists():
+        raise StructureStandardizationError(f"structure file not found: {input_path}")
+
+    input_format = _detect_format(input_path)
+    stat = input_path.stat()
+    key = (str(input_path.resolve()), stat.st_mtime_ns, stat.st_size, str(Path(out_dir).resolve()), input_format)
+    result = _standardize_cached(*key)
+    if not result.standardized_path.exists():
+        # output removed behind the cache (e.g. cleaned work dir): redo
+        _standardize_cached.cache_clear()
+        result = _standardize_cached(*key)
+    return result
+
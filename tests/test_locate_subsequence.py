@@ -40,6 +40,39 @@ def test_locate_subsequence_threshold(monkeypatch):
     assert locate is None
 
 
+def test_locate_subsequence_sliding_window_near_match(monkeypatch):
+    pytest.importorskip("numpy")
+    # no aligners and no exact substring: the approximate fallback should
+    # accept a unique window within the mismatch threshold
+    monkeypatch.setattr(normalize, "pairwise2", None)
+    monkeypatch.setattr(normalize, "edlib", None)
+
+    locate = normalize._locate_subsequence("AAAAAVVVVVAAAAA", "VVKVV")
+    assert locate is not None
+    assert locate["start"] == 5
+    assert locate["score"] == 4.0
+    assert locate["ambiguous"] is False
+
+
+def test_locate_subsequence_sliding_window_too_distant(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(normalize, "pairwise2", None)
+    monkeypatch.setattr(normalize, "edlib", None)
+
+    assert normalize._locate_subsequence("AAAAAAAAAA", "WWWWW") is None
+
+
+def test_locate_subsequence_sliding_window_ambiguous(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(normalize, "pairwise2", None)
+    monkeypatch.setattr(normalize, "edlib", None)
+
+    # the motif repeats, so two windows tie at the best mismatch count
+    locate = normalize._locate_subsequence("AAVVVVVAAVVVVVAA", "VVKVV")
+    assert locate is not None
+    assert locate["ambiguous"] is True
+
+
 def test_map_segment_to_chain_uses_alignment_score(monkeypatch):
     # disable pairwise2 to trigger substring path
     monkeypatch.setattr(normalize, "pairwise2", None)
@@ -8,9 +8,13 @@ import pytest
 from integrations.rfantibody import run_rfantibody
 
 
-class DummyCompletedProcess(subprocess.CompletedProcess[str]):
-    def __init__(self, args: list[str]):  # noqa: D401 - thin wrapper
-        super().__init__(args=args, returncode=0, stdout="", stderr="")
+class DummyPopen:
+    def __init__(self, args: list[str], **_kwargs):  # noqa: D401 - thin wrapper
+        self.args = args
+        self.returncode = 0
+
+    def wait(self, timeout: float | None = None) -> int:  # noqa: WPS110
+        return self.returncode
 
 
 @pytest.fixture
@@ -29,11 +33,11 @@ def test_run_rfantibody_prefers_user_params(monkeypatch: pytest.MonkeyPatch, fak
 
     captured_cmd: dict[str, list[str]] = {}
 
-    def _fake_run(cmd, **_kwargs):  # noqa: WPS430
+    def _fake_popen(cmd, **_kwargs):  # noqa: WPS430
         captured_cmd["cmd"] = cmd
-        return DummyCompletedProcess(cmd)
+        return DummyPopen(cmd)
 
-    monkeypatch.setattr(subprocess, "run", _fake_run)
+    monkeypatch.setattr(subprocess, "Popen", _fake_popen)
 
     normalization = {
         "target_hotspots_resolved_json": str(task_dir / "hotspots.json"),
@@ -68,11 +72,11 @@ def test_run_rfantibody_uses_normalization(monkeypatch: pytest.MonkeyPatch, fake
 
     captured_cmd: dict[str, list[str]] = {}
 
-    def _fake_run(cmd, **_kwargs):  # noqa: WPS430
+    def _fake_popen(cmd, **_kwargs):  # noqa: WPS430
         captured_cmd["cmd"] = cmd
-        return DummyCompletedProcess(cmd)
+        return DummyPopen(cmd)
 
-    monkeypatch.setattr(subprocess, "run", _fake_run)
+    monkeypatch.setattr(subprocess, "Popen", _fake_popen)
 
     hotspots_json = task_dir / "hotspots.json"
     hotspots_json.write_text(
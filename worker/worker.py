@@ -5,6 +5,7 @@ import logging
 
 from rq import Connection, Worker
 
+from pipeline.cdr import warm_numbering_backend
 from worker.queue import get_queue, get_redis_connection
 from worker import tasks  # noqa: F401  # ensure task functions are discoverable
 from api.config import get_settings
@@ -17,6 +18,9 @@ logger = logging.getLogger(__name__)
 
 
 def main() -> None:
+    # load the numbering model while the worker is still idle, so the first
+    # annotation job does not pay the HMM startup cost
+    warm_numbering_backend()
     settings = get_settings()
     connection = get_redis_connection()
     queue = get_queue(name=settings.queue_name, connection=connection)